@@ -5,6 +5,7 @@ A comprehensive toolkit for analyzing political statements, interviews, and disc
 to identify critical questioning patterns, biased language, and sentiment analysis.
 """
 
+from political_analysis_sdk.cache import ResponseCache, SemanticCache
 from political_analysis_sdk.cli import main as cli_main
 from political_analysis_sdk.config import Config
 from political_analysis_sdk.core import PoliticalStatementAnalyzer
@@ -15,7 +16,7 @@ from political_analysis_sdk.models import (
     SentimentAnalysis,
 )
 from political_analysis_sdk.prompts import PromptTemplates
-from political_analysis_sdk.utils import parse_srt_file, save_text_file
+from political_analysis_sdk.utils import parse_srt_file, parse_srt_files, save_text_file
 
 __version__ = "0.1.0"
 __all__ = [
@@ -25,8 +26,11 @@ __all__ = [
     "BiasAnalysis",
     "SentimentAnalysis",
     "PromptTemplates",
+    "ResponseCache",
+    "SemanticCache",
     "Config",
     "cli_main",
     "parse_srt_file",
+    "parse_srt_files",
     "save_text_file",
 ]
@@ -0,0 +1,170 @@
+"""
+On-disk cache for LLM responses.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Exact-match cache of LLM completions stored as one JSON file per request.
+
+    Requests are keyed on the SHA-256 of ``(model, temperature, messages)``, so a
+    transcript that has been analyzed before with the same settings is answered
+    from disk instead of repeating the LLM round-trip.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory where cached responses are stored (created if missing)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, temperature: float, messages: List[Dict[str, Any]]) -> str:
+        """Build the cache key for a completion request."""
+        payload = json.dumps([model, temperature, messages], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response content for a key, or None on a miss."""
+        try:
+            return orjson.loads(self._path(key).read_bytes())["content"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+    def set(self, key: str, content: str) -> None:
+        """Store response content for a key."""
+        with self._lock:
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps({"content": content}))
+                os.replace(tmp_path, self._path(key))
+            except OSError as e:
+                Path(tmp_path).unlink(missing_ok=True)
+                logger.warning(f"Failed to write cache entry {key}: {e}")
+
+    def delete(self, key: str) -> None:
+        """Remove the cached response for a key, e.g. one that no longer validates."""
+        with self._lock:
+            self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+
+class SemanticCache:
+    """
+    Similarity cache of LLM responses keyed on text embeddings.
+
+    Entries are grouped in namespaces (e.g. one per analysis type and model) and
+    stored as one JSON Lines file per namespace. A lookup returns the response for
+    the most similar stored text if its cosine similarity reaches the threshold,
+    so near-duplicate transcripts reuse an earlier response.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], threshold: float = 0.95):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory where cached responses are stored (created if missing)
+            threshold: Minimum cosine similarity for a text to count as a hit
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self._entries: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> List[float]:
+        norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+        return [x / norm for x in embedding]
+
+    def _path(self, namespace: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(namespace.encode('utf-8')).hexdigest()}.jsonl"
+
+    def _load(self, namespace: str) -> List[Any]:
+        """Return the (normalized embedding, content) entries of a namespace, reading them on first use."""
+        entries = self._entries.get(namespace)
+        if entries is not None:
+            return entries
+
+        entries = []
+        try:
+            with open(self._path(namespace), "rb") as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line)
+                        entries.append((record["embedding"], record["content"]))
+                    except (ValueError, KeyError) as e:
+                        logger.warning(f"Ignoring unreadable semantic cache entry: {e}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to read semantic cache {namespace}: {e}")
+
+        self._entries[namespace] = entries
+        return entries
+
+    def get(self, namespace: str, embedding: Sequence[float]) -> Optional[str]:
+        """Return the response of the most similar cached text, or None if none is similar enough."""
+        query = self._normalize(embedding)
+        with self._lock:
+            entries = self._load(namespace)
+
+        best_score, best_content = self.threshold, None
+        for stored, content in entries:
+            score = sum(a * b for a, b in zip(query, stored))
+            if score >= best_score:
+                best_score, best_content = score, content
+        return best_content
+
+    def set(self, namespace: str, embedding: Sequence[float], content: str) -> None:
+        """Store the response for a text embedding."""
+        stored = self._normalize(embedding)
+        with self._lock:
+            entries = self._load(namespace)
+            try:
+                with open(self._path(namespace), "ab") as f:
+                    f.write(orjson.dumps({"embedding": stored, "content": content}) + b"\n")
+            except OSError as e:
+                logger.warning(f"Failed to write semantic cache entry: {e}")
+                return
+            entries.append((stored, content))
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            for path in self.cache_dir.glob("*.jsonl"):
+                path.unlink(missing_ok=True)
+            self._entries.clear()
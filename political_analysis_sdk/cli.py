@@ -4,12 +4,23 @@ Command-line interface for the Political Statement Analysis SDK.
 """
 
 import argparse
-import json
+import functools
+import glob
+import logging
+import os
 import sys
+from dataclasses import asdict
 from pathlib import Path
+from typing import Optional, Union
+
+import orjson
 
 from political_analysis_sdk.config import Config
 from political_analysis_sdk.core import PoliticalStatementAnalyzer
+from political_analysis_sdk.models import AnalysisResult
+
+_MODELS = Config.get_supported_models()
+_LANGUAGES = Config.get_supported_languages()
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -25,6 +36,9 @@ Examples:
   # Analyze text directly
   python -m political_analysis_sdk.cli analyze-text "Sample political text here"
 
+  # Analyze many text files at once
+  python -m political_analysis_sdk.cli analyze-batch "transcripts/*.txt" --output results.json
+
   # Use custom model and language
   python -m political_analysis_sdk.cli analyze-file interview.txt --model gpt-3.5-turbo --language English
 
@@ -33,6 +47,9 @@ Examples:
         """
     )
 
+    # A cache directory from the environment enables the response cache by default
+    env_cache_dir = os.getenv(Config.ENV_CACHE_DIR)
+
     # Create subparsers for different commands
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
 
@@ -44,19 +61,31 @@ Examples:
     text_parser = subparsers.add_parser('analyze-text', help='Analyze text directly')
     text_parser.add_argument('text', help='Text content to analyze')
 
-    # Common options for both commands
-    for subparser in [file_parser, text_parser]:
+    # Analyze batch command
+    batch_parser = subparsers.add_parser('analyze-batch', help='Analyze many text files')
+    batch_parser.add_argument('files', nargs='+', help='Paths or glob patterns of the text files to analyze')
+    batch_parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=8,
+        help='Maximum number of concurrent LLM requests (default: 8)'
+    )
+
+    # Common options for the analysis commands
+    for subparser in [file_parser, text_parser, batch_parser]:
         subparser.add_argument(
             '--model', '-m',
             default=Config.DEFAULT_MODEL,
-            choices=Config.get_supported_models(),
-            help=f'LLM model to use (default: {Config.DEFAULT_MODEL})'
+            choices=_MODELS,
+            metavar='MODEL',
+            help=f'LLM model to use, see list-models (default: {Config.DEFAULT_MODEL})'
         )
         subparser.add_argument(
             '--language', '-l',
             default=Config.DEFAULT_LANGUAGE,
-            choices=Config.get_supported_languages(),
-            help=f'Language for analysis (default: {Config.DEFAULT_LANGUAGE})'
+            choices=_LANGUAGES,
+            metavar='LANGUAGE',
+            help=f'Language for analysis, see list-languages (default: {Config.DEFAULT_LANGUAGE})'
         )
         subparser.add_argument(
             '--temperature', '-t',
@@ -64,6 +93,48 @@ Examples:
             default=Config.DEFAULT_TEMPERATURE,
             help=f'Temperature for LLM responses (default: {Config.DEFAULT_TEMPERATURE})'
         )
+        subparser.add_argument(
+            '--cache',
+            nargs='?',
+            const=env_cache_dir or Config.DEFAULT_CACHE_DIR,
+            default=env_cache_dir,
+            metavar='CACHE_DIR',
+            help=(
+                f'Cache LLM responses on disk (default directory: ${Config.ENV_CACHE_DIR} or '
+                f'{Config.DEFAULT_CACHE_DIR}; always enabled when ${Config.ENV_CACHE_DIR} is set)'
+            )
+        )
+        subparser.add_argument(
+            '--semantic-threshold',
+            type=float,
+            default=None,
+            metavar='SIMILARITY',
+            help='With --cache, also reuse responses for near-duplicate texts above this similarity (e.g. 0.95)'
+        )
+        subparser.add_argument(
+            '--chunk-tokens',
+            type=int,
+            default=None,
+            metavar='N',
+            help='Analyze texts longer than N tokens in chunks and merge the results (default: no chunking)'
+        )
+        subparser.add_argument(
+            '--chunk-overlap',
+            type=int,
+            default=100,
+            metavar='N',
+            help='Repeat up to N tokens of trailing sentences at the start of the next chunk (default: 100)'
+        )
+        subparser.add_argument(
+            '--single-pass',
+            action='store_true',
+            help='Run all analyses with one combined prompt per text (one LLM call instead of three)'
+        )
+        subparser.add_argument(
+            '--no-summary',
+            action='store_true',
+            help='Skip the LLM summary of the results (saves one LLM call per text)'
+        )
         subparser.add_argument(
             '--output', '-o',
             help='Output file for results (JSON format)'
@@ -81,79 +152,103 @@ Examples:
     return parser
 
 
+@functools.lru_cache(maxsize=8)
+def get_analyzer(
+    model: str,
+    language: str,
+    temperature: float,
+    base_url: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    stream: bool = False,
+    chunk_tokens: Optional[int] = None,
+    chunk_overlap: int = 100,
+    semantic_cache_threshold: Optional[float] = None,
+    single_pass: bool = False
+) -> PoliticalStatementAnalyzer:
+    """Return a shared analyzer for the given settings, creating it on first use."""
+    return PoliticalStatementAnalyzer(
+        model_name=model,
+        language=language,
+        temperature=temperature,
+        base_url=base_url,
+        cache_dir=cache_dir,
+        stream=stream,
+        on_stream_item=print_stream_item if stream else None,
+        chunk_tokens=chunk_tokens,
+        chunk_overlap=chunk_overlap,
+        semantic_cache_threshold=semantic_cache_threshold,
+        single_pass=single_pass
+    )
+
+
 def analyze_file(file_path: str, args: argparse.Namespace) -> dict:
     """Analyze a text file."""
-    analyzer = PoliticalStatementAnalyzer(
-        model_name=args.model,
-        language=args.language,
-        temperature=args.temperature
+    analyzer = get_analyzer(
+        args.model, args.language, args.temperature, cache_dir=args.cache, stream=args.verbose,
+        chunk_tokens=args.chunk_tokens, chunk_overlap=args.chunk_overlap,
+        semantic_cache_threshold=args.semantic_threshold, single_pass=args.single_pass
     )
 
-    result = analyzer.analyze_text_file(file_path)
+    result = analyzer.analyze_text_file(file_path, include_summary=not args.no_summary)
     return result_to_dict(result)
 
 
 def analyze_text(text: str, args: argparse.Namespace) -> dict:
     """Analyze text directly."""
-    analyzer = PoliticalStatementAnalyzer(
-        model_name=args.model,
-        language=args.language,
-        temperature=args.temperature
+    analyzer = get_analyzer(
+        args.model, args.language, args.temperature, cache_dir=args.cache, stream=args.verbose,
+        chunk_tokens=args.chunk_tokens, chunk_overlap=args.chunk_overlap,
+        semantic_cache_threshold=args.semantic_threshold, single_pass=args.single_pass
     )
 
-    result = analyzer.analyze_text(text)
+    result = analyzer.analyze_text(text, include_summary=not args.no_summary)
     return result_to_dict(result)
 
 
-def result_to_dict(result) -> dict:
+def analyze_batch(patterns: list, args: argparse.Namespace) -> list:
+    """Analyze all text files matching the given paths or glob patterns."""
+    file_paths = expand_file_patterns(patterns)
+    if not file_paths:
+        raise FileNotFoundError(f"No files found matching: {' '.join(patterns)}")
+
+    analyzer = get_analyzer(
+        args.model, args.language, args.temperature, cache_dir=args.cache, stream=args.verbose,
+        chunk_tokens=args.chunk_tokens, chunk_overlap=args.chunk_overlap,
+        semantic_cache_threshold=args.semantic_threshold, single_pass=args.single_pass
+    )
+
+    results = analyzer.analyze_text_files(
+        file_paths, max_concurrency=args.max_concurrency, include_summary=not args.no_summary
+    )
+    return [result_to_dict(result) for result in results]
+
+
+def expand_file_patterns(patterns: list) -> list:
+    """Expand glob patterns into a sorted, de-duplicated list of file paths."""
+    file_paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) or ([pattern] if Path(pattern).exists() else [])
+        for match in matches:
+            if match not in file_paths and Path(match).is_file():
+                file_paths.append(match)
+    return file_paths
+
+
+def result_to_dict(result: AnalysisResult) -> dict:
     """Convert AnalysisResult to dictionary for JSON output."""
-    return {
-        'text_file_path': result.text_file_path,
-        'total_questions': result.total_questions,
-        'critical_questions': result.critical_questions,
-        'confirming_questions': result.confirming_questions,
-        'biased_adjectives': [
-            {
-                'adjective': b.adjective,
-                'target_person': b.target_person,
-                'bias_type': b.bias_type,
-                'confidence': b.confidence,
-                'reasoning': b.reasoning,
-                'context': b.context
-            }
-            for b in result.biased_adjectives
-        ],
-        'entity_sentiments': [
-            {
-                'entity_name': s.entity_name,
-                'entity_type': s.entity_type,
-                'sentiment': s.sentiment.value,
-                'confidence': s.confidence,
-                'reasoning': s.reasoning,
-                'context': s.context,
-                'supporting_quotes': s.supporting_quotes
-            }
-            for s in result.entity_sentiments
-        ],
-        'question_analysis': [
-            {
-                'question_text': q.question_text,
-                'question_type': q.question_type.value,
-                'confidence': q.confidence,
-                'reasoning': q.reasoning,
-                'context': q.context
-            }
-            for q in result.question_analysis
-        ],
-        'summary': result.summary,
-        'metadata': result.metadata
-    }
+    # The enums are str subclasses, so the nested dicts are JSON serializable as-is
+    return asdict(result)
+
+
+def print_stream_item(key: str, item: dict):
+    """Print a partial result as soon as it has been streamed."""
+    print(f"[{key}] {orjson.dumps(item).decode()}", file=sys.stderr)
 
 
 def print_results(results: dict, args: argparse.Namespace):
     """Print analysis results to console."""
     if args.verbose:
-        print(json.dumps(results, indent=2, ensure_ascii=False))
+        print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
     else:
         print("Analysis completed successfully!")
         print(f"Total questions: {results['total_questions']}")
@@ -161,13 +256,14 @@ def print_results(results: dict, args: argparse.Namespace):
         print(f"Confirming questions: {results['confirming_questions']}")
         print(f"Biased adjectives found: {len(results['biased_adjectives'])}")
         print(f"Entities analyzed: {len(results['entity_sentiments'])}")
-        print(f"\nSummary:\n{results['summary']}")
+        if results['summary']:
+            print(f"\nSummary:\n{results['summary']}")
 
 
-def save_results(results: dict, output_file: str):
+def save_results(results: Union[dict, list], output_file: str):
     """Save results to output file."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
     print(f"Results saved to: {output_file}")
 
 
@@ -180,6 +276,11 @@ def main():
         parser.print_help()
         return
 
+    if getattr(args, 'semantic_threshold', None) is not None and not args.cache:
+        parser.error("--semantic-threshold requires --cache")
+
+    logging.basicConfig(level=logging.INFO if getattr(args, 'verbose', False) else logging.WARNING)
+
     try:
         if args.command == 'analyze-file':
             if not Path(args.file_path).exists():
@@ -199,14 +300,23 @@ def main():
             if args.output:
                 save_results(results, args.output)
 
+        elif args.command == 'analyze-batch':
+            results = analyze_batch(args.files, args)
+            for file_results in results:
+                print(f"\n=== {file_results['text_file_path']} ===")
+                print_results(file_results, args)
+
+            if args.output:
+                save_results(results, args.output)
+
         elif args.command == 'list-models':
             print("Supported LLM models:")
-            for model in Config.get_supported_models():
+            for model in sorted(_MODELS):
                 print(f"  - {model}")
 
         elif args.command == 'list-languages':
             print("Supported languages:")
-            for language in Config.get_supported_languages():
+            for language in sorted(_LANGUAGES):
                 print(f"  - {language}")
 
     except KeyboardInterrupt:
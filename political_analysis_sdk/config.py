@@ -3,7 +3,29 @@ Configuration settings for the Political Statement Analysis SDK.
 """
 
 import os
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet
+
+# Models and languages offered by the CLI, built once at import time
+SUPPORTED_MODELS: FrozenSet[str] = frozenset({
+    "gpt-4",
+    "gpt-4-turbo",
+    "gpt-4o",
+    "gpt-4o-mini",
+    "gpt-3.5-turbo",
+    "claude-3-5-sonnet-20241022",
+    "claude-3-5-haiku-20241022",
+    "claude-3-opus-20240229",
+})
+
+SUPPORTED_LANGUAGES: FrozenSet[str] = frozenset({
+    "Dutch",
+    "English",
+    "German",
+    "French",
+    "Spanish",
+    "Italian",
+    "Portuguese",
+})
 
 
 class Config:
@@ -14,11 +36,15 @@ class Config:
     DEFAULT_TEMPERATURE = 0.1
     DEFAULT_LANGUAGE = "Dutch"
 
+    # Response cache settings (caching is disabled unless a directory is configured)
+    DEFAULT_CACHE_DIR = "~/.cache/political_analysis_sdk"
+
     # Environment variable names
     ENV_API_KEY = "OPENAI_API_KEY"
     ENV_MODEL = "POLITICAL_ANALYSIS_MODEL"
     ENV_TEMPERATURE = "POLITICAL_ANALYSIS_TEMPERATURE"
     ENV_LANGUAGE = "POLITICAL_ANALYSIS_LANGUAGE"
+    ENV_CACHE_DIR = "POLITICAL_ANALYSIS_CACHE_DIR"
 
     @classmethod
     def get_default_config(cls) -> Dict[str, Any]:
@@ -27,7 +53,8 @@ class Config:
             "model": cls.DEFAULT_MODEL,
             "temperature": cls.DEFAULT_TEMPERATURE,
             "language": cls.DEFAULT_LANGUAGE,
-            "api_key": os.getenv(cls.ENV_API_KEY)
+            "api_key": os.getenv(cls.ENV_API_KEY),
+            "cache_dir": None
         }
 
     @classmethod
@@ -37,9 +64,20 @@ class Config:
             "model": os.getenv(cls.ENV_MODEL, cls.DEFAULT_MODEL),
             "temperature": float(os.getenv(cls.ENV_TEMPERATURE, cls.DEFAULT_TEMPERATURE)),
             "language": os.getenv(cls.ENV_LANGUAGE, cls.DEFAULT_LANGUAGE),
-            "api_key": os.getenv(cls.ENV_API_KEY)
+            "api_key": os.getenv(cls.ENV_API_KEY),
+            "cache_dir": os.getenv(cls.ENV_CACHE_DIR)
         }
 
+    @classmethod
+    def get_supported_models(cls) -> FrozenSet[str]:
+        """Get the LLM models offered by the CLI."""
+        return SUPPORTED_MODELS
+
+    @classmethod
+    def get_supported_languages(cls) -> FrozenSet[str]:
+        """Get the analysis languages offered by the CLI."""
+        return SUPPORTED_LANGUAGES
+
     @classmethod
     def validate_config(cls, config: Dict[str, Any]) -> bool:
         """Validate configuration values."""
@@ -2,22 +2,126 @@
 Core political statement analyzer using LLMs via litellm.
 """
 
-import json
+import asyncio
+import contextlib
+import hashlib
 import logging
+import re
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
+import httpx
 import litellm
+import orjson
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+from openai import AsyncOpenAI, OpenAI
+from pydantic import BaseModel, ValidationError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
+from political_analysis_sdk.cache import ResponseCache, SemanticCache
 from political_analysis_sdk.models import (
     AnalysisResult,
     BiasAnalysis,
     QuestionAnalysis,
     QuestionType,
     SentimentAnalysis,
-    SentimentType,
 )
 from political_analysis_sdk.prompts import PromptTemplates
+from political_analysis_sdk.schemas import (
+    RESPONSE_FORMATS,
+    BiasPayload,
+    CombinedPayload,
+    QuestionsPayload,
+    SentimentPayload,
+    parse_payload,
+)
+from political_analysis_sdk.streaming import JSONArrayStreamParser
+
+logger = logging.getLogger(__name__)
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+# Connection pool of the pooled LLM clients: up to 32 concurrent connections, 16 kept alive
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+# Transient provider failures (429, 5xx, timeouts, dropped connections) are retried;
+# other errors, such as invalid credentials, are not
+_RETRYABLE_ERRORS = (
+    litellm.RateLimitError,
+    litellm.APIConnectionError,
+    litellm.Timeout,
+    litellm.InternalServerError,
+    litellm.ServiceUnavailableError,
+)
+
+# Retry policy of all LLM calls, with jittered backoff so concurrent calls do not retry in lockstep
+_llm_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+    reraise=True
+)
+
+# Text embeddings kept for the semantic cache; only the analyses of texts in flight need them
+_EMBEDDING_CACHE_SIZE = 128
+
+# Sentence ends and paragraph breaks, where long texts may be split into chunks
+_CHUNK_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
+AnalysisLists = Tuple[List[QuestionAnalysis], List[BiasAnalysis], List[SentimentAnalysis]]
+AnalysisFutures = Tuple[Future, ...]
+Analysis = Tuple[str, Callable[[str, str], Tuple[str, str]], Type[BaseModel], Optional[str]]
+# (chunk, overlap): a chunk of a text and its leading sentences repeated from the previous chunk
+Chunk = Tuple[str, str]
+
+# (name, prompt builder, response schema, result key) of the three analyses
+_ANALYSES = (
+    ("question", PromptTemplates.get_question_analysis_prompt, QuestionsPayload, "questions"),
+    ("bias", PromptTemplates.get_bias_analysis_prompt, BiasPayload, "biased_adjectives"),
+    ("sentiment", PromptTemplates.get_sentiment_analysis_prompt, SentimentPayload, "entity_sentiments"),
+)
+
+# The single-pass analysis returns all three result arrays, so it has no single result key
+_SINGLE_PASS_ANALYSES = (
+    ("combined", PromptTemplates.get_combined_analysis_prompt, CombinedPayload, None),
+)
+
+# Result arrays of the single-pass response, streamed to on_stream_item as they are produced
+_COMBINED_STREAM_KEYS = tuple(key for _, _, _, key in _ANALYSES)
+
+# Final states of a provider batch job
+_BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def _normalize(value: str) -> str:
+    """Normalize a finding's text for comparison across chunks."""
+    return " ".join(value.split()).lower()
+
+
+def _in_overlap(text: str, overlap: str) -> bool:
+    """Return whether a normalized finding text occurs as whole words in a normalized overlap."""
+    return bool(text) and re.search(rf"(?<!\w){re.escape(text)}(?!\w)", overlap) is not None
+
+
+def _question_key(question: QuestionAnalysis) -> Tuple[str, ...]:
+    """Identity of a question, to recognize it when two overlapping chunks report it."""
+    return (_normalize(question.question_text),)
+
+
+def _bias_key(bias: BiasAnalysis) -> Tuple[str, ...]:
+    """Identity of a biased adjective, to recognize it when two overlapping chunks report it."""
+    return _normalize(bias.adjective), _normalize(bias.target_person)
+
+
+def _sentiment_key(sentiment: SentimentAnalysis) -> Tuple[str, ...]:
+    """Identity of an entity sentiment: the (entity_name, entity_type) it is about."""
+    return _normalize(sentiment.entity_name), _normalize(sentiment.entity_type)
 
 
 class PoliticalStatementAnalyzer:
@@ -31,7 +135,15 @@ class PoliticalStatementAnalyzer:
         api_key: Optional[str] = None,
         language: str = "Dutch",
         temperature: float = 0.1,
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        stream: bool = False,
+        on_stream_item: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        chunk_tokens: Optional[int] = None,
+        chunk_overlap: int = 100,
+        semantic_cache_threshold: Optional[float] = None,
+        embedding_model: str = "text-embedding-3-small",
+        single_pass: bool = False
     ):
         """
         Initialize the analyzer.
@@ -42,69 +154,422 @@ class PoliticalStatementAnalyzer:
             language: Language for analysis (default: Dutch)
             temperature: Temperature for LLM responses (default: 0.1 for consistency)
             base_url: Base URL for custom API endpoints (e.g., LMStudio)
+            cache_dir: Directory for caching LLM responses (default: None, caching disabled)
+            stream: Stream LLM responses instead of waiting for the full completion
+            on_stream_item: Callback invoked with (analysis key, raw item) for every result
+                            item as soon as it has been streamed, e.g. ("questions", {...})
+            chunk_tokens: Split texts longer than this many tokens into chunks that are
+                          analyzed separately and merged (default: None, no chunking)
+            chunk_overlap: Repeat up to this many tokens of trailing sentences at the start of
+                           the next chunk, so statements at a boundary keep their context (default: 100)
+            semantic_cache_threshold: Also reuse cached responses for texts whose embedding has at
+                                      least this cosine similarity, e.g. 0.95 (requires cache_dir,
+                                      default: None, disabled)
+            embedding_model: Embedding model for the semantic cache (default: text-embedding-3-small)
+            single_pass: Run the question, bias and sentiment analyses with one combined prompt
+                         per text instead of three separate calls (default: False)
         """
         self.model_name = model_name
         self.language = language
         self.temperature = temperature
         self.base_url = base_url
+        self.cache = ResponseCache(cache_dir) if cache_dir else None
+        self.semantic_cache = (
+            SemanticCache(Path(cache_dir) / "semantic", semantic_cache_threshold)
+            if cache_dir and semantic_cache_threshold is not None else None
+        )
+        if semantic_cache_threshold is not None and not cache_dir:
+            logger.warning("semantic_cache_threshold has no effect without cache_dir")
+        self.embedding_model = embedding_model
+        self.stream = stream
+        self.on_stream_item = on_stream_item
+        self.chunk_tokens = chunk_tokens
+        self.chunk_overlap = chunk_overlap
+        self.single_pass = single_pass
+        self.logger = logger
+
+        # Per-analyzer litellm settings, passed to every call instead of mutating
+        # litellm's module globals, so analyzers with different endpoints can coexist.
+        # base_url points at custom endpoints such as LMStudio.
+        self._completion_kwargs: Dict[str, Any] = {
+            "model": model_name,
+            "temperature": temperature,
+            "api_key": api_key,
+            "api_base": base_url
+        }
+
+        # Pooled HTTP connections shared by all calls of this analyzer, created on first use
+        self._http_client: Optional[httpx.Client] = None
+        self._llm_client: Optional[Any] = None
+        self._llm_client_ready = False
+        self._client_lock = threading.Lock()
+        # Async clients by event loop, as async connections cannot outlive the loop they were opened on,
+        # and the number of async calls and ``async with`` blocks using each of them
+        self._async_llm_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Optional[Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_client_users: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Text embeddings for the semantic cache, shared by the analyses of a text; the least
+        # recently used ones are dropped beyond _EMBEDDING_CACHE_SIZE texts
+        self._embeddings: "OrderedDict[str, Future]" = OrderedDict()
+        self._embedding_lock = threading.Lock()
+
+    def __enter__(self) -> "PoliticalStatementAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
-        # Configure litellm
-        if api_key:
-            litellm.api_key = api_key
+    async def __aenter__(self) -> "PoliticalStatementAnalyzer":
+        # Keep the async connections open across the calls of the block
+        loop = asyncio.get_running_loop()
+        self._async_client_users[loop] = self._async_client_users.get(loop, 0) + 1
+        return self
 
-        # Configure custom base URL for LMStudio or other local models
-        if base_url:
-            # For local models like LMStudio, set the base URL
-            litellm.api_base = base_url
+    async def __aexit__(self, *exc_info) -> None:
+        await self._release_async_llm_client()
+        self.close()
 
-        # Configure logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+    def close(self) -> None:
+        """Close the pooled HTTP connections of this analyzer."""
+        with self._client_lock:
+            if self._http_client is not None:
+                self._http_client.close()
+            self._http_client = None
+            self._llm_client = None
+            self._llm_client_ready = False
 
-    def analyze_text_file(self, file_path: str) -> AnalysisResult:
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections of this analyzer, including the async ones of the running loop."""
+        self.close()
+        async_llm_client = self._async_llm_clients.pop(asyncio.get_running_loop(), None)
+        if async_llm_client is not None:
+            await async_llm_client.close()
+
+    @contextlib.asynccontextmanager
+    async def _async_llm_client_scope(self) -> AsyncIterator[None]:
+        """
+        Keep the async client of the running loop open for the duration of an async call.
+
+        The client is shared by concurrent calls on the same loop and closed when the
+        last of them (or the enclosing ``async with`` block) finishes, so a call made
+        with ``asyncio.run`` does not leave its connections open after the loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        self._async_client_users[loop] = self._async_client_users.get(loop, 0) + 1
+        try:
+            yield
+        finally:
+            await self._release_async_llm_client()
+
+    async def _release_async_llm_client(self) -> None:
+        """Drop a user of the running loop's async client and close the client after the last one."""
+        loop = asyncio.get_running_loop()
+        users = self._async_client_users.get(loop, 1) - 1
+        if users > 0:
+            self._async_client_users[loop] = users
+            return
+
+        self._async_client_users.pop(loop, None)
+        async_llm_client = self._async_llm_clients.pop(loop, None)
+        if async_llm_client is not None:
+            await async_llm_client.close()
+
+    def _get_provider(self) -> Optional[str]:
+        """Return the litellm provider of this analyzer's model, or None if it is unknown."""
+        try:
+            _, provider, _, _ = litellm.get_llm_provider(self.model_name, api_base=self.base_url)
+        except Exception:
+            # Let litellm report unknown models when the completion is requested
+            return None
+        return provider
+
+    def _get_llm_client(self) -> Optional[Any]:
+        """
+        Return the client litellm should use for this analyzer's provider.
+
+        OpenAI and Anthropic requests share one keep-alive connection pool, so the
+        TCP/TLS handshake is paid once rather than per call, and concurrent requests
+        are multiplexed over HTTP/2 where the endpoint supports it. Other providers keep
+        litellm's default client handling, as they expect provider-specific clients.
+        """
+        with self._client_lock:
+            if self._llm_client_ready:
+                return self._llm_client
+
+            provider = self._get_provider()
+            if provider in ("openai", "anthropic"):
+                self._http_client = httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=60)
+                if provider == "openai":
+                    self._llm_client = OpenAI(
+                        api_key=self._completion_kwargs["api_key"],
+                        base_url=self.base_url,
+                        http_client=self._http_client
+                    )
+                else:
+                    self._llm_client = HTTPHandler(client=self._http_client)
+
+            self._llm_client_ready = True
+            return self._llm_client
+
+    def _get_async_llm_client(self) -> Optional[Any]:
+        """
+        Return the client litellm should use for this analyzer's async calls.
+
+        Every event loop gets its own client, so a later ``asyncio.run`` never reuses
+        connections bound to the closed loop of an earlier one; it is closed when the
+        async calls using it finish (see ``_async_llm_client_scope``).
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self._async_llm_clients:
+            async_llm_client = None
+            provider = self._get_provider()
+            if provider == "openai":
+                async_llm_client = AsyncOpenAI(
+                    api_key=self._completion_kwargs["api_key"],
+                    base_url=self.base_url,
+                    http_client=httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, timeout=60)
+                )
+            elif provider == "anthropic":
+                async_llm_client = AsyncHTTPHandler(
+                    timeout=60,
+                    transport=httpx.AsyncHTTPTransport(http2=True, limits=_HTTP_LIMITS)
+                )
+
+            self._async_llm_clients[loop] = async_llm_client
+
+        return self._async_llm_clients[loop]
+
+    def analyze_text_file(self, file_path: str, include_summary: bool = True) -> AnalysisResult:
         """
         Analyze a text file containing political statements.
 
         Args:
             file_path: Path to the text file to analyze
+            include_summary: Whether to create an LLM summary of the results
 
         Returns:
             AnalysisResult containing all analysis data
         """
         file_path = Path(file_path)
+        text_content = self._read_text_file(file_path)
 
+        self.logger.info(f"Analyzing text file: {file_path}")
+
+        # Perform all analyses
+        question_analysis, bias_analysis, sentiment_analysis = self._run_analyses(text_content)
+
+        return self._build_result(
+            str(file_path), question_analysis, bias_analysis, sentiment_analysis, include_summary
+        )
+
+    def _read_text_file(self, file_path: Path) -> str:
+        """Read a text file to analyze."""
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Read the text file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            text_content = f.read()
+        return file_path.read_text(encoding='utf-8')
 
-        self.logger.info(f"Analyzing text file: {file_path}")
+    def _run_analyses(self, text: str) -> AnalysisLists:
+        """
+        Run the question, bias and sentiment analyses concurrently.
 
-        # Perform all analyses
-        question_analysis = self._analyze_questions(text_content)
-        bias_analysis = self._analyze_bias(text_content)
-        sentiment_analysis = self._analyze_sentiment(text_content)
-
-        # Create summary
-        summary = self._create_summary({
-            'total_questions': len(question_analysis),
-            'critical_questions': len([q for q in question_analysis if q.question_type == QuestionType.CRITICAL]),
-            'confirming_questions': len([q for q in question_analysis if q.question_type == QuestionType.CONFIRMING]),
-            'biased_adjectives': bias_analysis,
-            'entity_sentiments': sentiment_analysis
-        })
+        The three analyses are independent, network-bound LLM calls, so they are
+        dispatched on a small thread pool and wall time is that of the slowest call.
+        Long texts are analyzed chunk by chunk on the same pool and merged.
+        """
+        chunks = self._chunk_text(text)
+        with ThreadPoolExecutor(max_workers=min(3 * len(chunks), 16)) as executor:
+            return self._collect_analyses(chunks, self._submit_analyses(executor, chunks))
+
+    def _chunk_text(self, text: str) -> List[Chunk]:
+        """
+        Split a text into (chunk, overlap) pairs of chunks of at most ``chunk_tokens`` tokens.
+
+        Chunks are cut at sentence ends and paragraph breaks; a single sentence longer
+        than the limit becomes its own chunk. Each chunk starts with the trailing
+        sentences of the previous one, up to ``chunk_overlap`` tokens, so a question
+        and its context are not separated by a cut; that repeated text is the overlap.
+        Returns the text unchanged when chunking is disabled or the text is short enough.
+        """
+        if not self.chunk_tokens or litellm.token_counter(model=self.model_name, text=text) <= self.chunk_tokens:
+            return [(text, "")]
+
+        chunks: List[Chunk] = []
+        current: List[Tuple[str, int]] = []
+        current_tokens = 0
+        overlap = ""
+        for segment in _CHUNK_BOUNDARY.split(text):
+            segment = segment.strip()
+            if not segment:
+                continue
+
+            segment_tokens = litellm.token_counter(model=self.model_name, text=segment)
+            if current and current_tokens + segment_tokens > self.chunk_tokens:
+                chunks.append((" ".join(part for part, _ in current), overlap))
+                current = self._chunk_overlap_segments(current)
+                current_tokens = sum(tokens for _, tokens in current)
+                if current_tokens + segment_tokens > self.chunk_tokens:
+                    current, current_tokens = [], 0
+                overlap = " ".join(part for part, _ in current)
+
+            current.append((segment, segment_tokens))
+            current_tokens += segment_tokens
+
+        if current:
+            chunks.append((" ".join(part for part, _ in current), overlap))
+
+        self.logger.info(f"Split text into {len(chunks)} chunks of at most {self.chunk_tokens} tokens")
+        return chunks
+
+    def _chunk_overlap_segments(self, segments: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
+        """Return the trailing (segment, tokens) of a finished chunk to repeat in the next chunk."""
+        overlap: List[Tuple[str, int]] = []
+        overlap_tokens = 0
+        # Never repeat the whole chunk, or the next chunk would not advance
+        for segment, tokens in reversed(segments[1:]):
+            if overlap_tokens + tokens > self.chunk_overlap:
+                break
+            overlap.append((segment, tokens))
+            overlap_tokens += tokens
+        overlap.reverse()
+        return overlap
+
+    def _analyses(self) -> Tuple[Analysis, ...]:
+        """Return the analyses to run on every chunk: the three separate ones or the combined one."""
+        return _SINGLE_PASS_ANALYSES if self.single_pass else _ANALYSES
+
+    def _submit_analyses(self, executor: ThreadPoolExecutor, chunks: List[Chunk]) -> List[AnalysisFutures]:
+        """Queue the question, bias and sentiment analyses of every chunk."""
+        return [
+            tuple(executor.submit(self._analyze, analysis, chunk) for analysis in self._analyses())
+            for chunk, _ in chunks
+        ]
+
+    def _collect_analyses(self, chunks: List[Chunk], futures: List[AnalysisFutures]) -> AnalysisLists:
+        """Wait for the analyses of all chunks of a text and merge them."""
+        return self._merge_analyses(chunks, [
+            self._chunk_result(tuple(future.result() for future in chunk_futures))
+            for chunk_futures in futures
+        ])
+
+    @staticmethod
+    def _chunk_result(results: Tuple[Any, ...]) -> AnalysisLists:
+        """Return the (questions, biases, sentiments) of a chunk from the results of its analyses."""
+        # A single-pass analysis returns all three lists at once
+        return results[0] if len(results) == 1 else results
+
+    def _merge_analyses(self, chunks: List[Chunk], chunk_results: List[AnalysisLists]) -> AnalysisLists:
+        """
+        Merge the question, bias and sentiment analyses of all chunks of a text.
+
+        Questions and biases repeated by a chunk overlap are merged; the sentiments
+        towards an entity are merged across all chunks into the most confident one.
+        """
+        overlaps = [_normalize(overlap) for _, overlap in chunks]
+        questions, biases, sentiments = zip(*chunk_results)
+        return (
+            self._merge_chunk_findings(questions, overlaps, _question_key),
+            self._merge_chunk_findings(biases, overlaps, _bias_key),
+            self._merge_entity_sentiments(sentiments)
+        )
+
+    @staticmethod
+    def _merge_entity_sentiments(chunk_sentiments: Tuple[List[SentimentAnalysis], ...]) -> List[SentimentAnalysis]:
+        """Keep the most confident sentiment per (entity_name, entity_type), in order of first mention."""
+        merged: Dict[Tuple[str, ...], SentimentAnalysis] = {}
+        for sentiments in chunk_sentiments:
+            for sentiment in sentiments:
+                key = _sentiment_key(sentiment)
+                if key not in merged or sentiment.confidence > merged[key].confidence:
+                    merged[key] = sentiment
+        return list(merged.values())
+
+    @staticmethod
+    def _merge_chunk_findings(
+        chunk_findings: Tuple[List[Any], ...],
+        overlaps: List[str],
+        key: Callable[[Any], Tuple[str, ...]]
+    ) -> List[Any]:
+        """
+        Concatenate the findings of consecutive chunks, merging those reported twice because of an overlap.
+
+        A finding of a chunk is the previous chunk's finding repeated only when its text
+        (the first element of its key) occurs as whole words in the overlap the chunk
+        starts with and the previous chunk reported a finding with the same key that is
+        not matched yet; the more confident of the two is kept. All other findings are
+        kept, so a question that is really asked twice is counted twice, and without
+        overlap nothing is merged.
+        """
+        merged: List[Any] = []
+        previous: Dict[Tuple[str, ...], List[int]] = {}
+        for findings, overlap in zip(chunk_findings, overlaps):
+            current: Dict[Tuple[str, ...], List[int]] = {}
+            for finding in findings:
+                finding_key = key(finding)
+                positions = previous.get(finding_key)
+                if positions and _in_overlap(finding_key[0], overlap):
+                    position = positions.pop(0)
+                    if finding.confidence > merged[position].confidence:
+                        merged[position] = finding
+                else:
+                    position = len(merged)
+                    merged.append(finding)
+                current.setdefault(finding_key, []).append(position)
+            previous = current
+        return merged
+
+    def _build_result(
+        self,
+        text_file_path: str,
+        question_analysis: List[QuestionAnalysis],
+        bias_analysis: List[BiasAnalysis],
+        sentiment_analysis: List[SentimentAnalysis],
+        include_summary: bool = True
+    ) -> AnalysisResult:
+        """Summarize the analyses and assemble them into an AnalysisResult."""
+        result = self._assemble_result(text_file_path, question_analysis, bias_analysis, sentiment_analysis)
+        if include_summary:
+            result = replace(result, summary=self._create_summary(result))
+        return result
+
+    async def _abuild_result(
+        self,
+        text_file_path: str,
+        question_analysis: List[QuestionAnalysis],
+        bias_analysis: List[BiasAnalysis],
+        sentiment_analysis: List[SentimentAnalysis],
+        include_summary: bool = True
+    ) -> AnalysisResult:
+        """Async version of ``_build_result``."""
+        result = self._assemble_result(text_file_path, question_analysis, bias_analysis, sentiment_analysis)
+        if include_summary:
+            result = replace(result, summary=await self._acreate_summary(result))
+        return result
+
+    def _assemble_result(
+        self,
+        text_file_path: str,
+        question_analysis: List[QuestionAnalysis],
+        bias_analysis: List[BiasAnalysis],
+        sentiment_analysis: List[SentimentAnalysis]
+    ) -> AnalysisResult:
+        """Assemble the analyses into an AnalysisResult without a summary."""
+        # Count all question types in a single pass
+        question_types = Counter(q.question_type for q in question_analysis)
 
         return AnalysisResult(
-            text_file_path=str(file_path),
+            text_file_path=text_file_path,
             total_questions=len(question_analysis),
-            critical_questions=len([q for q in question_analysis if q.question_type == QuestionType.CRITICAL]),
-            confirming_questions=len([q for q in question_analysis if q.question_type == QuestionType.CONFIRMING]),
+            critical_questions=question_types[QuestionType.CRITICAL],
+            confirming_questions=question_types[QuestionType.CONFIRMING],
             biased_adjectives=bias_analysis,
             entity_sentiments=sentiment_analysis,
             question_analysis=question_analysis,
-            summary=summary,
+            summary="",
             metadata={
                 'model_used': self.model_name,
                 'language': self.language,
@@ -112,244 +577,498 @@ class PoliticalStatementAnalyzer:
             }
         )
 
-    def _analyze_questions(self, text: str) -> List[QuestionAnalysis]:
-        """Analyze question patterns in the text."""
-        prompt = PromptTemplates.get_question_analysis_prompt(text, self.language)
+    def _build_messages(self, prompt: str, system_prompt: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Build the chat messages for a prompt.
+
+        The optional system prompt is sent first and marked for provider-side prompt
+        caching, so its static instructions can be reused across calls.
+        """
+        messages: List[Dict[str, Any]] = []
+        if system_prompt:
+            messages.append({
+                "role": "system",
+                "content": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            })
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _get_cached(self, messages: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
+        """Return (cache key, cached content); both are None when caching is disabled."""
+        if self.cache is None:
+            return None, None
+
+        cache_key = ResponseCache.make_key(self.model_name, self.temperature, messages)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"Using cached response from {self.model_name}")
+        return cache_key, cached
+
+    def _get_semantic_cached(
+        self, system_prompt: str, prompt: str
+    ) -> Tuple[Optional[Tuple[str, List[float]]], Optional[str]]:
+        """
+        Return ((namespace, embedding), cached content) from the semantic cache.
+
+        The namespace is derived from the model, temperature and system prompt, so only
+        responses to the same analysis are reused. Both values are None when the semantic
+        cache is disabled or the text could not be embedded.
+        """
+        if self.semantic_cache is None:
+            return None, None
 
         try:
-            self.logger.info(f"Sending question analysis prompt to {self.model_name}")
-            response = litellm.completion(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=self.temperature
-            )
+            embedding = self._embed(prompt)
+        except Exception as e:
+            self.logger.warning(f"Skipping semantic cache, embedding failed: {e}")
+            return None, None
 
-            content = response.choices[0].message.content.strip()
-            self.logger.info(f"Received response from {self.model_name}, length: {len(content)}")
+        namespace = ResponseCache.make_key(
+            self.model_name, self.temperature, [{"role": "system", "content": system_prompt}]
+        )
+        cached = self.semantic_cache.get(namespace, embedding)
+        if cached is not None:
+            self.logger.info(f"Using semantically cached response from {self.model_name}")
+        return (namespace, embedding), cached
 
-            # Check if content is empty
-            if not content:
-                self.logger.warning("Empty response from LLM for question analysis")
-                return []
+    def _embed(self, text: str) -> List[float]:
+        """Embed a text, computing the embedding only once for concurrent analyses of the same text."""
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._embedding_lock:
+            future = self._embeddings.get(key)
+            owner = future is None
+            if owner:
+                future = self._embeddings[key] = Future()
+                if len(self._embeddings) > _EMBEDDING_CACHE_SIZE:
+                    self._embeddings.popitem(last=False)
+            else:
+                self._embeddings.move_to_end(key)
 
-            # Try to parse JSON, with fallback handling
+        if owner:
             try:
-                data = json.loads(content)
-                self.logger.info("Successfully parsed JSON response for question analysis")
-            except json.JSONDecodeError as json_error:
-                self.logger.error(f"Failed to parse JSON response for questions: {json_error}")
-                self.logger.error(f"Raw response content: {repr(content)}")
-                # Try to extract JSON from the response if it's wrapped in other text
-                try:
-                    # Look for JSON-like content between curly braces
-                    start_idx = content.find('{')
-                    end_idx = content.rfind('}') + 1
-                    if start_idx != -1 and end_idx > start_idx:
-                        json_content = content[start_idx:end_idx]
-                        self.logger.info(f"Attempting to extract JSON: {repr(json_content)}")
-                        data = json.loads(json_content)
-                        self.logger.info("Successfully parsed extracted JSON")
-                    else:
-                        return []
-                except Exception as extract_error:
-                    self.logger.error(f"Failed to extract JSON: {extract_error}")
-                    return []
-
-            questions = []
-            for q_data in data.get('questions', []):
-                try:
-                    question_type = QuestionType(q_data.get('type', 'neutral'))
-                    questions.append(QuestionAnalysis(
-                        question_text=q_data.get('question', ''),
-                        question_type=question_type,
-                        confidence=q_data.get('confidence', 0.0),
-                        reasoning=q_data.get('reasoning', ''),
-                        context=q_data.get('context', '')
-                    ))
-                except Exception as e:
-                    self.logger.warning(f"Error processing question data: {e}")
-                    continue
+                response = litellm.embedding(model=self.embedding_model, input=[text])
+                future.set_result(response.data[0]["embedding"])
+            except Exception as e:
+                with self._embedding_lock:
+                    if self._embeddings.get(key) is future:
+                        del self._embeddings[key]
+                future.set_exception(e)
 
-            return questions
+        return future.result()
 
-        except Exception as e:
-            self.logger.error(f"Error analyzing questions: {e}")
-            return []
+    def _complete(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """
+        Send a prompt to the LLM and return the stripped response content.
+
+        Responses are served from and stored in the response cache when enabled.
+        Transient failures are retried with backoff.
+        """
+        messages = self._build_messages(prompt, system_prompt)
+        cache_key, content = self._get_cached(messages)
+        if content is not None:
+            return content
+
+        content, _ = self._request_validated(messages)
+        if content and cache_key is not None:
+            self.cache.set(cache_key, content)
+
+        return content
+
+    async def _acomplete(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        """Async version of ``_complete``."""
+        messages = self._build_messages(prompt, system_prompt)
+        cache_key, content = self._get_cached(messages)
+        if content is not None:
+            return content
+
+        content, _ = await self._arequest_validated(messages)
+        if content and cache_key is not None:
+            self.cache.set(cache_key, content)
+
+        return content
+
+    def _run_llm(
+        self,
+        prompt: str,
+        system_prompt: str,
+        response_model: Type[ResponseModel],
+        stream_keys: Tuple[str, ...] = ()
+    ) -> ResponseModel:
+        """
+        Send a prompt to the LLM and validate the response against a schema.
+
+        The schema is passed as ``response_format``, so providers that support
+        structured output return matching JSON; for other providers it is dropped
+        and the JSON instructions in the prompt apply. Only responses that pass
+        validation are cached; a cached response that no longer validates is
+        evicted and requested again.
+        """
+        messages = self._build_messages(prompt, system_prompt)
+        cache_key, content = self._get_cached(messages)
+        result = self._validate_cached(response_model, content, cache_key)
+        if result is not None:
+            return result
+
+        semantic_entry, content = self._get_semantic_cached(system_prompt, prompt)
+        result = self._validate_cached(response_model, content)
+        if result is not None:
+            return result
+
+        content, result = self._request_validated(messages, response_model, stream_keys, Counter())
+        if cache_key is not None:
+            self.cache.set(cache_key, content)
+        if semantic_entry is not None:
+            self.semantic_cache.set(*semantic_entry, content)
+
+        return result
+
+    async def _arun_llm(
+        self,
+        prompt: str,
+        system_prompt: str,
+        response_model: Type[ResponseModel],
+        stream_keys: Tuple[str, ...] = ()
+    ) -> ResponseModel:
+        """Async version of ``_run_llm``."""
+        messages = self._build_messages(prompt, system_prompt)
+        cache_key, content = self._get_cached(messages)
+        result = self._validate_cached(response_model, content, cache_key)
+        if result is not None:
+            return result
+
+        semantic_entry, content = await asyncio.to_thread(self._get_semantic_cached, system_prompt, prompt)
+        result = self._validate_cached(response_model, content)
+        if result is not None:
+            return result
+
+        content, result = await self._arequest_validated(messages, response_model, stream_keys, Counter())
+        if cache_key is not None:
+            self.cache.set(cache_key, content)
+        if semantic_entry is not None:
+            self.semantic_cache.set(*semantic_entry, content)
 
-    def _analyze_bias(self, text: str) -> List[BiasAnalysis]:
-        """Analyze biased language in the text."""
-        prompt = PromptTemplates.get_bias_analysis_prompt(text, self.language)
+        return result
+
+    def _validate_cached(
+        self, response_model: Type[ResponseModel], content: Optional[str], cache_key: Optional[str] = None
+    ) -> Optional[ResponseModel]:
+        """Validate a cached response; an invalid one is evicted from the response cache and None returned."""
+        if content is None:
+            return None
+
+        try:
+            return parse_payload(response_model, content)
+        except ValidationError as e:
+            self.logger.warning(f"Ignoring invalid cached response from {self.model_name}: {e}")
+            if cache_key is not None:
+                self.cache.delete(cache_key)
+            return None
+
+    def _request_validated(
+        self,
+        messages: List[Dict[str, Any]],
+        response_model: Optional[Type[ResponseModel]] = None,
+        stream_keys: Tuple[str, ...] = (),
+        reported: Optional[Counter] = None
+    ) -> Tuple[str, Optional[ResponseModel]]:
+        """
+        Call the LLM and return the response content and, with a schema, the validated response.
+
+        A response that fails validation is requested once more right away; the backoff
+        of ``_request_completion`` is reserved for transient provider failures. ``reported``
+        counts the items streamed by earlier attempts, so a second attempt does not report
+        them to ``on_stream_item`` again.
+        """
+        content = self._request_completion(messages, response_model, stream_keys, reported)
+        self.logger.info(f"Received response from {self.model_name}, length: {len(content)}")
+        if response_model is None:
+            return content, None
 
         try:
-            self.logger.info(f"Sending bias analysis prompt to {self.model_name}")
+            return content, parse_payload(response_model, content)
+        except ValidationError as e:
+            self.logger.warning(f"Invalid response from {self.model_name}, requesting it once more: {e}")
+
+        content = self._request_completion(messages, response_model, stream_keys, reported)
+        self.logger.info(f"Received response from {self.model_name}, length: {len(content)}")
+        return content, parse_payload(response_model, content)
+
+    async def _arequest_validated(
+        self,
+        messages: List[Dict[str, Any]],
+        response_model: Optional[Type[ResponseModel]] = None,
+        stream_keys: Tuple[str, ...] = (),
+        reported: Optional[Counter] = None
+    ) -> Tuple[str, Optional[ResponseModel]]:
+        """Async version of ``_request_validated``."""
+        content = await self._arequest_completion(messages, response_model, stream_keys, reported)
+        self.logger.info(f"Received response from {self.model_name}, length: {len(content)}")
+        if response_model is None:
+            return content, None
+
+        try:
+            return content, parse_payload(response_model, content)
+        except ValidationError as e:
+            self.logger.warning(f"Invalid response from {self.model_name}, requesting it once more: {e}")
+
+        content = await self._arequest_completion(messages, response_model, stream_keys, reported)
+        self.logger.info(f"Received response from {self.model_name}, length: {len(content)}")
+        return content, parse_payload(response_model, content)
+
+    @_llm_retry
+    def _request_completion(
+        self,
+        messages: List[Dict[str, Any]],
+        response_format: Optional[Type[BaseModel]] = None,
+        stream_keys: Tuple[str, ...] = (),
+        reported: Optional[Counter] = None
+    ) -> str:
+        """
+        Call the LLM and return the stripped response content.
+
+        Transient failures are retried with jittered exponential backoff, other errors
+        are raised immediately. In streaming mode, items of the ``stream_keys`` arrays
+        are reported to ``on_stream_item`` as soon as they are complete, unless
+        ``reported`` shows an earlier attempt of the same request already reported them.
+        """
+        if self.stream:
             response = litellm.completion(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=self.temperature
+                messages=messages,
+                response_format=self._response_format(response_format),
+                drop_params=True,
+                stream=True,
+                stream_options={"include_usage": True},
+                client=self._get_llm_client(),
+                **self._completion_kwargs
             )
 
-            content = response.choices[0].message.content.strip()
-            self.logger.info(f"Received response from {self.model_name}, length: {len(content)}")
+            parsers = self._stream_parsers(stream_keys)
+            parts: List[str] = []
+            streamed: Counter = Counter()
+            for chunk in response:
+                self._handle_stream_chunk(chunk, parts, parsers, streamed, reported)
 
-            # Check if content is empty
-            if not content:
-                self.logger.warning("Empty response from LLM for bias analysis")
-                return []
+            return "".join(parts).strip()
 
-            # Try to parse JSON, with fallback handling
-            try:
-                data = json.loads(content)
-                self.logger.info("Successfully parsed JSON response for bias analysis")
-            except json.JSONDecodeError as json_error:
-                self.logger.error(f"Failed to parse JSON response for bias: {json_error}")
-                self.logger.error(f"Raw response content: {repr(content)}")
-                # Try to extract JSON from the response if it's wrapped in other text
-                try:
-                    # Look for JSON-like content between curly braces
-                    start_idx = content.find('{')
-                    end_idx = content.rfind('}') + 1
-                    if start_idx != -1 and end_idx > start_idx:
-                        json_content = content[start_idx:end_idx]
-                        self.logger.info(f"Attempting to extract JSON: {repr(json_content)}")
-                        data = json.loads(json_content)
-                        self.logger.info("Successfully parsed extracted JSON")
-                    else:
-                        return []
-                except Exception as extract_error:
-                    self.logger.error(f"Failed to extract JSON: {extract_error}")
-                    return []
-
-            biases = []
-            for b_data in data.get('biased_adjectives', []):
-                try:
-                    biases.append(BiasAnalysis(
-                        adjective=b_data.get('adjective', ''),
-                        target_person=b_data.get('target_person', ''),
-                        bias_type=b_data.get('bias_type', ''),
-                        confidence=b_data.get('confidence', 0.0),
-                        reasoning=b_data.get('reasoning', ''),
-                        context=b_data.get('context', '')
-                    ))
-                except Exception as e:
-                    self.logger.warning(f"Error processing bias data: {e}")
-                    continue
+        response = litellm.completion(
+            messages=messages,
+            response_format=self._response_format(response_format),
+            drop_params=True,
+            client=self._get_llm_client(),
+            **self._completion_kwargs
+        )
+        return self._response_content(response)
+
+    @_llm_retry
+    async def _arequest_completion(
+        self,
+        messages: List[Dict[str, Any]],
+        response_format: Optional[Type[BaseModel]] = None,
+        stream_keys: Tuple[str, ...] = (),
+        reported: Optional[Counter] = None
+    ) -> str:
+        """Async version of ``_request_completion``, using ``litellm.acompletion``."""
+        response = await litellm.acompletion(
+            messages=messages,
+            response_format=self._response_format(response_format),
+            drop_params=True,
+            stream=self.stream,
+            stream_options={"include_usage": True} if self.stream else None,
+            client=self._get_async_llm_client(),
+            **self._completion_kwargs
+        )
+
+        if self.stream:
+            parsers = self._stream_parsers(stream_keys)
+            parts: List[str] = []
+            streamed: Counter = Counter()
+            async for chunk in response:
+                self._handle_stream_chunk(chunk, parts, parsers, streamed, reported)
+
+            return "".join(parts).strip()
+
+        return self._response_content(response)
+
+    @staticmethod
+    def _response_format(response_model: Optional[Type[BaseModel]]) -> Optional[Dict[str, Any]]:
+        """Return the pregenerated JSON schema ``response_format`` of a response model."""
+        return RESPONSE_FORMATS[response_model] if response_model is not None else None
+
+    def _stream_parsers(self, stream_keys: Tuple[str, ...]) -> List[JSONArrayStreamParser]:
+        """Return a parser per ``stream_keys`` array if streamed items should be reported."""
+        return [JSONArrayStreamParser(key) for key in stream_keys] if self.on_stream_item else []
+
+    def _handle_stream_chunk(
+        self,
+        chunk: Any,
+        parts: List[str],
+        parsers: List[JSONArrayStreamParser],
+        streamed: Counter,
+        reported: Optional[Counter] = None
+    ) -> None:
+        """
+        Collect the content of a streamed chunk and report newly completed items.
+
+        ``streamed`` counts the items of this response; an item is only reported when
+        this response has streamed it more often than any earlier attempt in ``reported``.
+        """
+        # The usage is reported on the final chunk
+        self._log_usage(getattr(chunk, "usage", None))
+        if not chunk.choices:
+            return
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            return
+
+        parts.append(delta)
+        for parser in parsers:
+            for item in parser.feed(delta):
+                marker = (parser.key, orjson.dumps(item, option=orjson.OPT_SORT_KEYS))
+                streamed[marker] += 1
+                if reported is not None:
+                    if streamed[marker] <= reported[marker]:
+                        continue
+                    reported[marker] = streamed[marker]
+                self.on_stream_item(parser.key, item)
+
+    def _response_content(self, response: Any) -> str:
+        """Return the stripped content of a non-streamed completion."""
+        if not response or not response.choices or not response.choices[0].message:
+            raise ValueError("Invalid response structure from LLM")
+
+        self._log_usage(getattr(response, "usage", None))
 
-            return biases
+        return (response.choices[0].message.content or "").strip()
+
+    def _log_usage(self, usage: Any) -> None:
+        """Log the prompt tokens of a completion and how many were read from the provider's prompt cache."""
+        if not usage:
+            return
+
+        # OpenAI reports cached prompt tokens in prompt_tokens_details, Anthropic as cache_read_input_tokens
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) or getattr(usage, "cache_read_input_tokens", None) or 0
+        self.logger.info(
+            f"Prompt tokens from {self.model_name}: {usage.prompt_tokens}, read from prompt cache: {cached_tokens}"
+        )
+
+    def _analyze(self, analysis: Analysis, text: str) -> Any:
+        """
+        Run one analysis of ``_ANALYSES`` or ``_SINGLE_PASS_ANALYSES`` on a text.
+
+        Errors are logged and result in empty results, so one failing analysis does
+        not prevent the others from being reported.
+        """
+        name, get_prompts, response_model, key = analysis
+        system_prompt, prompt = get_prompts(text, self.language)
+
+        try:
+            self.logger.info(f"Sending {name} analysis prompt to {self.model_name}")
+            payload = self._run_llm(prompt, system_prompt, response_model, self._stream_keys(key))
+            return self._payload_results(payload, key)
 
         except Exception as e:
-            self.logger.error(f"Error analyzing bias: {e}")
-            return []
+            self.logger.error(f"Error in {name} analysis: {e}")
+            return self._payload_results(None, key)
 
-    def _analyze_sentiment(self, text: str) -> List[SentimentAnalysis]:
-        """Analyze sentiment towards entities in the text."""
-        prompt = PromptTemplates.get_sentiment_analysis_prompt(text, self.language)
+    async def _aanalyze(self, analysis: Analysis, text: str) -> Any:
+        """Async version of ``_analyze``."""
+        name, get_prompts, response_model, key = analysis
+        system_prompt, prompt = get_prompts(text, self.language)
 
         try:
-            self.logger.info(f"Sending sentiment analysis prompt to {self.model_name}")
+            self.logger.info(f"Sending {name} analysis prompt to {self.model_name}")
+            payload = await self._arun_llm(prompt, system_prompt, response_model, self._stream_keys(key))
+            return self._payload_results(payload, key)
 
-            # Check if we have a valid model configuration
-            if not self.model_name:
-                self.logger.error("No model name specified")
-                return []
+        except Exception as e:
+            self.logger.error(f"Error in {name} analysis: {e}")
+            return self._payload_results(None, key)
 
-            try:
-                response = litellm.completion(
-                    model=self.model_name,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=self.temperature
-                )
-            except Exception as api_error:
-                self.logger.error(f"API error during sentiment analysis: {api_error}")
-                return []
+    @staticmethod
+    def _stream_keys(key: Optional[str]) -> Tuple[str, ...]:
+        """Return the result arrays of an analysis response to report while streaming."""
+        # The single-pass analysis has no result key, its response holds all three arrays
+        return (key,) if key else _COMBINED_STREAM_KEYS
 
-            if not response or not response.choices or not response.choices[0].message:
-                self.logger.error("Invalid response structure from LLM")
-                return []
+    @staticmethod
+    def _payload_results(payload: Optional[BaseModel], key: Optional[str]) -> Any:
+        """
+        Return the result models of an analysis response, or empty results without one.
 
-            content = response.choices[0].message.content.strip()
-            self.logger.info(f"Received response from {self.model_name}, length: {len(content)}")
+        A single-pass response (no result key) gives the three lists of a chunk at once.
+        """
+        if key is None:
+            if payload is None:
+                return [], [], []
+            return payload.questions, payload.biased_adjectives, payload.entity_sentiments
 
-            # Check if content is empty
-            if not content:
-                self.logger.warning("Empty response from LLM for sentiment analysis")
-                return []
+        return getattr(payload, key) if payload is not None else []
 
-            # Try to parse JSON, with fallback handling
-            try:
-                data = json.loads(content)
-                self.logger.info("Successfully parsed JSON response for sentiment analysis")
-            except json.JSONDecodeError as json_error:
-                self.logger.error(f"Failed to parse JSON response for sentiment: {json_error}")
-                self.logger.error(f"Raw response content: {repr(content)}")
-                # Try to extract JSON from the response if it's wrapped in other text
-                try:
-                    # Look for JSON-like content between curly braces
-                    start_idx = content.find('{')
-                    end_idx = content.rfind('}') + 1
-                    if start_idx != -1 and end_idx > start_idx:
-                        json_content = content[start_idx:end_idx]
-                        self.logger.info(f"Attempting to extract JSON: {repr(json_content)}")
-                        data = json.loads(json_content)
-                        self.logger.info("Successfully parsed extracted JSON")
-                    else:
-                        return []
-                except Exception as extract_error:
-                    self.logger.error(f"Failed to extract JSON: {extract_error}")
-                    return []
-
-            sentiments = []
-            for s_data in data.get('entity_sentiments', []):
-                try:
-                    sentiment = SentimentType(s_data.get('sentiment', 'neutral'))
-                    sentiments.append(SentimentAnalysis(
-                        entity_name=s_data.get('entity_name', ''),
-                        entity_type=s_data.get('entity_type', ''),
-                        sentiment=sentiment,
-                        confidence=s_data.get('confidence', 0.0),
-                        reasoning=s_data.get('reasoning', ''),
-                        context=s_data.get('context', ''),
-                        supporting_quotes=s_data.get('supporting_quotes', [])
-                    ))
-                except Exception as e:
-                    self.logger.warning(f"Error processing sentiment data: {e}")
-                    continue
+    async def _arun_analyses(self, text: str) -> AnalysisLists:
+        """Run the question, bias and sentiment analyses of all chunks of a text concurrently."""
+        chunks = self._chunk_text(text)
+        chunk_results = await asyncio.gather(*(
+            asyncio.gather(*(self._aanalyze(analysis, chunk) for analysis in self._analyses()))
+            for chunk, _ in chunks
+        ))
+        return self._merge_analyses(chunks, [self._chunk_result(tuple(results)) for results in chunk_results])
 
-            return sentiments
+    def _summary_prompt(self, result: AnalysisResult) -> Optional[str]:
+        """Return the summary prompt for a result, or None when there is nothing to summarize."""
+        if not (result.question_analysis or result.biased_adjectives or result.entity_sentiments):
+            return None
 
-        except Exception as e:
-            self.logger.error(f"Error analyzing sentiment: {e}")
-            return []
+        return PromptTemplates.get_summary_prompt({
+            'total_questions': result.total_questions,
+            'critical_questions': result.critical_questions,
+            'confirming_questions': result.confirming_questions,
+            'biased_adjectives': result.biased_adjectives,
+            'entity_sentiments': result.entity_sentiments
+        }, self.language)
 
-    def _create_summary(self, analysis_results: Dict[str, Any]) -> str:
+    def _create_summary(self, result: AnalysisResult) -> str:
         """Create a summary of all analysis results."""
-        prompt = PromptTemplates.get_summary_prompt(analysis_results, self.language)
+        prompt = self._summary_prompt(result)
+        if prompt is None:
+            return "Geen vragen, biased taalgebruik of entiteiten gevonden om samen te vatten."
 
         try:
-            response = litellm.completion(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=self.temperature
-            )
+            return self._summary_or_fallback(self._complete(prompt))
 
-            content = response.choices[0].message.content.strip()
+        except Exception as e:
+            self.logger.error(f"Error creating summary: {e}")
+            return "Kon geen samenvatting maken vanwege een fout."
 
-            # Check if content is empty
-            if not content:
-                self.logger.warning("Empty response from LLM for summary creation")
-                return "Kon geen samenvatting maken - lege reactie van het model."
+    async def _acreate_summary(self, result: AnalysisResult) -> str:
+        """Async version of ``_create_summary``."""
+        prompt = self._summary_prompt(result)
+        if prompt is None:
+            return "Geen vragen, biased taalgebruik of entiteiten gevonden om samen te vatten."
 
-            return content
+        try:
+            return self._summary_or_fallback(await self._acomplete(prompt))
 
         except Exception as e:
             self.logger.error(f"Error creating summary: {e}")
             return "Kon geen samenvatting maken vanwege een fout."
 
-    def analyze_text(self, text: str) -> AnalysisResult:
+    def _summary_or_fallback(self, content: str) -> str:
+        """Return the summary content, or a notice when the model returned nothing."""
+        if not content:
+            self.logger.warning("Empty response from LLM for summary creation")
+            return "Kon geen samenvatting maken - lege reactie van het model."
+
+        return content
+
+    def analyze_text(self, text: str, include_summary: bool = True) -> AnalysisResult:
         """
         Analyze text content directly (without file).
 
         Args:
             text: Text content to analyze
+            include_summary: Whether to create an LLM summary of the results
 
         Returns:
             AnalysisResult containing all analysis data
@@ -358,50 +1077,346 @@ class PoliticalStatementAnalyzer:
 
         try:
             # Perform all analyses
-            question_analysis = self._analyze_questions(text)
-            bias_analysis = self._analyze_bias(text)
-            sentiment_analysis = self._analyze_sentiment(text)
-
-            # Create summary
-            summary = self._create_summary({
-                'total_questions': len(question_analysis),
-                'critical_questions': len([q for q in question_analysis if q.question_type == QuestionType.CRITICAL]),
-                'confirming_questions': len([q for q in question_analysis if q.question_type == QuestionType.CONFIRMING]),
-                'biased_adjectives': bias_analysis,
-                'entity_sentiments': sentiment_analysis
-            })
+            question_analysis, bias_analysis, sentiment_analysis = self._run_analyses(text)
 
-            return AnalysisResult(
-                text_file_path="direct_text_input",
-                total_questions=len(question_analysis),
-                critical_questions=len([q for q in question_analysis if q.question_type == QuestionType.CRITICAL]),
-                confirming_questions=len([q for q in question_analysis if q.question_type == QuestionType.CONFIRMING]),
-                biased_adjectives=bias_analysis,
-                entity_sentiments=sentiment_analysis,
-                question_analysis=question_analysis,
-                summary=summary,
-                metadata={
-                    'model_used': self.model_name,
-                    'language': self.language,
-                    'temperature': self.temperature
-                }
+            return self._build_result(
+                "direct_text_input", question_analysis, bias_analysis, sentiment_analysis, include_summary
             )
         except Exception as e:
             self.logger.error(f"Error in analyze_text: {e}")
-            # Return a minimal result with error information
-            return AnalysisResult(
-                text_file_path="direct_text_input",
-                total_questions=0,
-                critical_questions=0,
-                confirming_questions=0,
-                biased_adjectives=[],
-                entity_sentiments=[],
-                question_analysis=[],
-                summary=f"Fout tijdens analyse: {str(e)}",
-                metadata={
-                    'model_used': self.model_name,
-                    'language': self.language,
-                    'temperature': self.temperature,
-                    'error': str(e)
-                }
+            return self._error_result(e)
+
+    async def aanalyze_text(self, text: str, include_summary: bool = True) -> AnalysisResult:
+        """
+        Analyze text content directly (without file), using async LLM calls.
+
+        Args:
+            text: Text content to analyze
+            include_summary: Whether to create an LLM summary of the results
+
+        Returns:
+            AnalysisResult containing all analysis data
+        """
+        self.logger.info("Analyzing provided text content")
+
+        try:
+            async with self._async_llm_client_scope():
+                question_analysis, bias_analysis, sentiment_analysis = await self._arun_analyses(text)
+
+                return await self._abuild_result(
+                    "direct_text_input", question_analysis, bias_analysis, sentiment_analysis, include_summary
+                )
+        except Exception as e:
+            self.logger.error(f"Error in aanalyze_text: {e}")
+            return self._error_result(e)
+
+    async def aanalyze_text_file(self, file_path: str, include_summary: bool = True) -> AnalysisResult:
+        """
+        Analyze a text file containing political statements, using async LLM calls.
+
+        Args:
+            file_path: Path to the text file to analyze
+            include_summary: Whether to create an LLM summary of the results
+
+        Returns:
+            AnalysisResult containing all analysis data
+        """
+        file_path = Path(file_path)
+        text_content = self._read_text_file(file_path)
+
+        self.logger.info(f"Analyzing text file: {file_path}")
+
+        async with self._async_llm_client_scope():
+            question_analysis, bias_analysis, sentiment_analysis = await self._arun_analyses(text_content)
+
+            return await self._abuild_result(
+                str(file_path), question_analysis, bias_analysis, sentiment_analysis, include_summary
             )
+
+    def _error_result(self, error: Exception) -> AnalysisResult:
+        """Return a minimal result with error information for a failed direct text analysis."""
+        return AnalysisResult(
+            text_file_path="direct_text_input",
+            total_questions=0,
+            critical_questions=0,
+            confirming_questions=0,
+            biased_adjectives=[],
+            entity_sentiments=[],
+            question_analysis=[],
+            summary=f"Fout tijdens analyse: {str(error)}",
+            metadata={
+                'model_used': self.model_name,
+                'language': self.language,
+                'temperature': self.temperature,
+                'error': str(error)
+            }
+        )
+
+    def analyze_batch(
+        self, texts: List[str], max_concurrency: int = 8, include_summary: bool = True
+    ) -> List[AnalysisResult]:
+        """
+        Analyze many texts, sharing one pool of workers for all LLM calls.
+
+        Args:
+            texts: Text contents to analyze
+            max_concurrency: Maximum number of LLM requests in flight at once
+            include_summary: Whether to create an LLM summary for every text
+
+        Returns:
+            One AnalysisResult per text, in input order
+        """
+        self.logger.info(f"Analyzing batch of {len(texts)} texts")
+        items = [("direct_text_input", text) for text in texts]
+        return self._analyze_many(items, max_concurrency, include_summary)
+
+    def analyze_text_files(
+        self, file_paths: List[str], max_concurrency: int = 8, include_summary: bool = True
+    ) -> List[AnalysisResult]:
+        """
+        Analyze many text files, sharing one pool of workers for all LLM calls.
+
+        Args:
+            file_paths: Paths to the text files to analyze
+            max_concurrency: Maximum number of LLM requests in flight at once
+            include_summary: Whether to create an LLM summary for every file
+
+        Returns:
+            One AnalysisResult per file, in input order
+        """
+        items = []
+        for file_path in map(Path, file_paths):
+            items.append((str(file_path), self._read_text_file(file_path)))
+
+        self.logger.info(f"Analyzing batch of {len(items)} text files")
+        return self._analyze_many(items, max_concurrency, include_summary)
+
+    def _analyze_many(
+        self, items: List[Tuple[str, str]], max_concurrency: int, include_summary: bool = True
+    ) -> List[AnalysisResult]:
+        """
+        Analyze (source, text) pairs on one bounded thread pool.
+
+        All analysis calls (three per text, or per chunk of a long text) are queued
+        up front; each summary is queued as soon as the analyses of its text are
+        done, so the pool stays saturated.
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            pending = []
+            for source, text in items:
+                chunks = self._chunk_text(text)
+                pending.append((source, chunks, self._submit_analyses(executor, chunks)))
+
+            results = [
+                executor.submit(self._build_result, source, *self._collect_analyses(chunks, futures), include_summary)
+                for source, chunks, futures in pending
+            ]
+            return [result.result() for result in results]
+
+    def analyze_batch_api(
+        self, texts: List[str], poll_interval: float = 60.0, include_summary: bool = True
+    ) -> List[AnalysisResult]:
+        """
+        Analyze many texts through the provider's Batch API.
+
+        All analysis requests are submitted as a single batch job, which the provider
+        processes asynchronously (within 24 hours) at a reduced price. This call
+        blocks until the job has finished. Only OpenAI and Azure models are supported.
+
+        Args:
+            texts: Text contents to analyze
+            poll_interval: Seconds to wait between checks of the batch status
+            include_summary: Whether to create an LLM summary for every text
+
+        Returns:
+            One AnalysisResult per text, in input order
+        """
+        self.logger.info(f"Analyzing batch of {len(texts)} texts with the Batch API")
+        items = [("direct_text_input", text) for text in texts]
+        return self._analyze_many_batch_api(items, poll_interval, include_summary)
+
+    def analyze_text_files_batch_api(
+        self, file_paths: List[str], poll_interval: float = 60.0, include_summary: bool = True
+    ) -> List[AnalysisResult]:
+        """
+        Analyze many text files through the provider's Batch API.
+
+        Args:
+            file_paths: Paths to the text files to analyze
+            poll_interval: Seconds to wait between checks of the batch status
+            include_summary: Whether to create an LLM summary for every file
+
+        Returns:
+            One AnalysisResult per file, in input order
+        """
+        items = []
+        for file_path in map(Path, file_paths):
+            items.append((str(file_path), self._read_text_file(file_path)))
+
+        self.logger.info(f"Analyzing batch of {len(items)} text files with the Batch API")
+        return self._analyze_many_batch_api(items, poll_interval, include_summary)
+
+    def _analyze_many_batch_api(
+        self, items: List[Tuple[str, str]], poll_interval: float, include_summary: bool = True
+    ) -> List[AnalysisResult]:
+        """
+        Analyze (source, text) pairs with one provider batch job.
+
+        Every (text, chunk, analysis) becomes one batch request with custom_id
+        ``"<text>:<chunk>:<key>"``; requests answered by a valid response cache entry
+        are not submitted, invalid entries are evicted and requested again. The
+        summaries are created afterwards with regular calls.
+        """
+        # Requests to submit and their response cache keys, by custom_id
+        requests: Dict[str, Tuple[List[Dict[str, Any]], Type[BaseModel]]] = {}
+        cache_keys: Dict[str, Optional[str]] = {}
+        # Results of the requests answered by the response cache, by custom_id
+        cached: Dict[str, Any] = {}
+        # Chunks of every text, with the (custom_id, analysis) of every analysis of every chunk
+        layout: List[Tuple[List[Chunk], List[List[Tuple[str, Analysis]]]]] = []
+        for idx, (_, text) in enumerate(items):
+            chunks = self._chunk_text(text)
+            chunk_layout = []
+            for chunk_idx, (chunk, _) in enumerate(chunks):
+                analyses = []
+                for analysis in self._analyses():
+                    name, get_prompts, response_model, key = analysis
+                    system_prompt, prompt = get_prompts(chunk, self.language)
+                    messages = self._build_messages(prompt, system_prompt)
+                    custom_id = f"{idx}:{chunk_idx}:{name}"
+                    cache_key, content = self._get_cached(messages)
+                    payload = self._validate_cached(response_model, content, cache_key)
+                    if payload is not None:
+                        cached[custom_id] = self._payload_results(payload, key)
+                    else:
+                        requests[custom_id] = (messages, response_model)
+                        cache_keys[custom_id] = cache_key
+                    analyses.append((custom_id, analysis))
+                chunk_layout.append(analyses)
+            layout.append((chunks, chunk_layout))
+
+        contents = self._run_batch_job(requests, poll_interval) if requests else {}
+
+        analyses_per_item = []
+        for chunks, chunk_layout in layout:
+            chunk_results = []
+            for analyses in chunk_layout:
+                chunk_results.append(self._chunk_result(tuple(
+                    cached[custom_id] if custom_id in cached
+                    else self._parse_batch_content(analysis, contents.get(custom_id), cache_keys.get(custom_id))
+                    for custom_id, analysis in analyses
+                )))
+            analyses_per_item.append(self._merge_analyses(chunks, chunk_results))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = [
+                executor.submit(self._build_result, source, *analyses, include_summary)
+                for (source, _), analyses in zip(items, analyses_per_item)
+            ]
+            return [result.result() for result in results]
+
+    def _run_batch_job(
+        self, requests: Dict[str, Tuple[List[Dict[str, Any]], Type[BaseModel]]], poll_interval: float
+    ) -> Dict[str, str]:
+        """
+        Submit chat completion requests as one batch job and wait for it to finish.
+
+        Returns:
+            Response content by custom_id for the requests that succeeded
+        """
+        model, provider, _, _ = litellm.get_llm_provider(self.model_name, api_base=self.base_url)
+        if provider not in ("openai", "azure"):
+            raise ValueError(f"The Batch API is not supported for model {self.model_name}")
+
+        provider_kwargs = {
+            "custom_llm_provider": provider,
+            "api_key": self._completion_kwargs["api_key"],
+            "api_base": self.base_url
+        }
+
+        # Batch requests go to the provider as-is, so only send a response_format it accepts,
+        # as drop_params does for interactive calls
+        supports_response_schema = litellm.supports_response_schema(model=model, custom_llm_provider=provider)
+
+        lines = []
+        for custom_id, (messages, response_model) in requests.items():
+            body = {
+                "model": model,
+                "temperature": self.temperature,
+                # Drop litellm-only message fields
+                "messages": [{"role": m["role"], "content": m["content"]} for m in messages]
+            }
+            if supports_response_schema:
+                body["response_format"] = RESPONSE_FORMATS[response_model]
+            lines.append(orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }))
+
+        input_file = litellm.create_file(
+            file=("batch_requests.jsonl", b"\n".join(lines)),
+            purpose="batch",
+            **provider_kwargs
+        )
+        batch = litellm.create_batch(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=input_file.id,
+            **provider_kwargs
+        )
+        self.logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+
+        while batch.status not in _BATCH_FINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = litellm.retrieve_batch(batch_id=batch.id, **provider_kwargs)
+            self.logger.info(f"Batch {batch.id} status: {batch.status}")
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        contents: Dict[str, str] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+
+            output = litellm.file_content(file_id=file_id, **provider_kwargs)
+            for line in output.content.splitlines():
+                if not line.strip():
+                    continue
+
+                record = orjson.loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    self.logger.error(
+                        f"Batch request {record.get('custom_id')} failed: {record.get('error') or response.get('body')}"
+                    )
+                    continue
+
+                content = response["body"]["choices"][0]["message"].get("content") or ""
+                contents[record["custom_id"]] = content.strip()
+
+        return contents
+
+    def _parse_batch_content(
+        self,
+        analysis: Analysis,
+        content: Optional[str],
+        cache_key: Optional[str]
+    ) -> Any:
+        """Validate the content of one batch request into result models."""
+        name, _, response_model, key = analysis
+        if content is None:
+            return self._payload_results(None, key)
+
+        try:
+            payload = parse_payload(response_model, content)
+        except Exception as e:
+            self.logger.error(f"Error in {name} analysis: {e}")
+            return self._payload_results(None, key)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, content)
+
+        return self._payload_results(payload, key)
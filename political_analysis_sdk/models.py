@@ -2,61 +2,69 @@
 Data models for political statement analysis results.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List
 
 
-class SentimentType(Enum):
-    """Enumeration for sentiment types."""
+class SentimentType(str, Enum):
+    """Enumeration for sentiment types (values serialize as plain strings)."""
     POSITIVE = "positive"
     NEGATIVE = "negative"
     NEUTRAL = "neutral"
     MIXED = "mixed"
 
 
-class QuestionType(Enum):
-    """Enumeration for question types."""
+class QuestionType(str, Enum):
+    """Enumeration for question types (values serialize as plain strings)."""
     CRITICAL = "critical"
     CONFIRMING = "confirming"
     FOLLOW_UP = "follow_up"
     NEUTRAL = "neutral"
 
 
-@dataclass
+def _question_json_name(field_name: str) -> str:
+    """Name of a QuestionAnalysis field in the LLM's JSON response."""
+    return {"question_text": "question", "question_type": "type"}.get(field_name, field_name)
+
+
+@dataclass(slots=True, frozen=True)
 class QuestionAnalysis:
     """Analysis results for question patterns."""
-    question_text: str
-    question_type: QuestionType
-    confidence: float
-    reasoning: str
-    context: str
+    # Used when pydantic validates LLM responses directly into this class
+    __pydantic_config__ = {"alias_generator": _question_json_name}
+
+    question_text: str = ""
+    question_type: QuestionType = QuestionType.NEUTRAL
+    confidence: float = 0.0
+    reasoning: str = ""
+    context: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BiasAnalysis:
     """Analysis results for biased language usage."""
-    adjective: str
-    target_person: str
-    bias_type: str
-    confidence: float
-    reasoning: str
-    context: str
+    adjective: str = ""
+    target_person: str = ""
+    bias_type: str = ""
+    confidence: float = 0.0
+    reasoning: str = ""
+    context: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SentimentAnalysis:
     """Analysis results for sentiment towards entities."""
-    entity_name: str
-    entity_type: str  # person, company, party
-    sentiment: SentimentType
-    confidence: float
-    reasoning: str
-    context: str
-    supporting_quotes: List[str]
+    entity_name: str = ""
+    entity_type: str = ""  # person, company, party
+    sentiment: SentimentType = SentimentType.NEUTRAL
+    confidence: float = 0.0
+    reasoning: str = ""
+    context: str = ""
+    supporting_quotes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisResult:
     """Complete analysis result for a political statement text."""
     text_file_path: str
@@ -2,81 +2,48 @@
 Prompt templates for political statement analysis using LLMs.
 """
 
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
-
-class PromptTemplates:
-    """Collection of adaptable prompt templates for political analysis."""
-
-    @staticmethod
-    def get_question_analysis_prompt(text: str, language: str = "Dutch") -> str:
-        """Generate prompt for analyzing question patterns."""
-        return f"""Analyzeer de volgende tekst in het {language} en identificeer alle vragen.
+_QUESTION_TASK = """
+        Identificeer alle vragen in de tekst.
         Classificeer elke vraag als:
         - "critical": Kritische wedervragen die uitdagen of in twijfel trekken
         - "confirming": Bevestigende follow-up vragen die bevestigen
         - "follow_up": Neutrale follow-up vragen voor verduidelijking
         - "neutral": Gewone neutrale vragen
+"""
 
-        Tekst:
-        {text}
-
-        BELANGRIJK: Geef je antwoord ALLEEN in geldig JSON formaat, zonder extra tekst ervoor of erna.
-        {{
-            "questions": [
-                {{
+_QUESTION_ITEM = """                {
                     "question": "de vraag tekst",
                     "type": "critical|confirming|follow_up|neutral",
                     "confidence": 0.95,
                     "reasoning": "waarom deze classificatie",
                     "context": "context rond de vraag"
-                }}
-            ]
-        }}
-
-        Als er geen vragen zijn gevonden, geef dan: {{"questions": []}}"""
+                }"""
 
-    @staticmethod
-    def get_bias_analysis_prompt(text: str, language: str = "Dutch") -> str:
-        """Generate prompt for analyzing biased language."""
-        return f"""Analyzeer de volgende tekst in het {language} en identificeer alle niet-neutrale,
-        kwalificerende bijvoeglijke naamwoorden die worden gebruikt om personen te beschrijven.
+_BIAS_TASK = """
+        Identificeer alle niet-neutrale, kwalificerende bijvoeglijke naamwoorden
+        die in de tekst worden gebruikt om personen te beschrijven.
 
         Zoek naar woorden die een oordeel, vooroordeel of bias uitdrukken.
+"""
 
-        Tekst:
-        {text}
-
-        BELANGRIJK: Geef je antwoord ALLEEN in geldig JSON formaat, zonder extra tekst ervoor of erna.
-        {{
-            "biased_adjectives": [
-                {{
+_BIAS_ITEM = """                {
                     "adjective": "het bijvoeglijk naamwoord",
                     "target_person": "naam van de persoon",
                     "bias_type": "positief/negatief/pejoratief/etc",
                     "confidence": 0.95,
                     "reasoning": "waarom dit biased is",
                     "context": "context van gebruik"
-                }}
-            ]
-        }}
-
-        Als er geen biased bijvoeglijke naamwoorden zijn gevonden, geef dan: {{"biased_adjectives": []}}"""
-
-    @staticmethod
-    def get_sentiment_analysis_prompt(text: str, language: str = "Dutch") -> str:
-        """Generate prompt for analyzing sentiment towards entities."""
-        return f"""Analyzeer de volgende tekst in het {language} en identificeer alle
-        uitspraken over bedrijven, partijen en personen. Bepaal of er positief,
-        negatief of neutraal over wordt gesproken.
+                }"""
 
-        Tekst:
-        {text}
+_SENTIMENT_TASK = """
+        Identificeer alle uitspraken in de tekst over bedrijven, partijen en personen.
+        Bepaal of er positief, negatief of neutraal over wordt gesproken.
+"""
 
-        BELANGRIJK: Geef je antwoord ALLEEN in geldig JSON formaat, zonder extra tekst ervoor of erna.
-        {{
-            "entity_sentiments": [
-                {{
+_SENTIMENT_ITEM = """                {
                     "entity_name": "naam van entiteit",
                     "entity_type": "person|company|party",
                     "sentiment": "positive|negative|neutral|mixed",
@@ -84,11 +51,114 @@ class PromptTemplates:
                     "reasoning": "waarom deze sentiment",
                     "context": "context van de uitspraak",
                     "supporting_quotes": ["quote 1", "quote 2"]
-                }}
-            ]
+                }"""
+
+
+def _json_format(**items: str) -> str:
+    """Describe the expected JSON object, with one example item per result array."""
+    arrays = ",\n".join(f'            "{key}": [\n{item}\n            ]' for key, item in items.items())
+    return f"""
+        Gebruik het volgende JSON formaat:
+        {{
+{arrays}
         }}
 
-        Als er geen entiteiten zijn gevonden, geef dan: {{"entity_sentiments": []}}"""
+        """
+
+
+class PromptTemplates:
+    """
+    Collection of adaptable prompt templates for political analysis.
+
+    The analysis prompts are split into a static system prompt (instructions and
+    JSON schema, determined only by the language) and a user prompt holding the text.
+    Keeping the text out of the system prompt lets providers with prompt caching
+    reuse the instruction prefix across calls. The system prompts are built once per
+    language and reused.
+    """
+
+    @staticmethod
+    def _get_system_preamble(language: str) -> str:
+        """Instructions shared by all analysis prompts, so they form a common cacheable prefix."""
+        return f"""Je bent een expert in het analyseren van politieke uitspraken, interviews en discussies.
+        Het bericht van de gebruiker bevat de volledige tekst in het {language} die je moet analyseren.
+
+        BELANGRIJK: Geef je antwoord ALLEEN in geldig JSON formaat, zonder extra tekst ervoor of erna.
+        """
+
+    @staticmethod
+    def get_question_analysis_prompt(text: str, language: str = "Dutch") -> Tuple[str, str]:
+        """Generate (system, user) prompts for analyzing question patterns."""
+        return PromptTemplates._question_system_prompt(language), text
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _question_system_prompt(language: str) -> str:
+        """Build the question analysis system prompt, once per language."""
+        return (
+            PromptTemplates._get_system_preamble(language)
+            + _QUESTION_TASK
+            + _json_format(questions=_QUESTION_ITEM)
+            + 'Als er geen vragen zijn gevonden, geef dan: {"questions": []}'
+        )
+
+    @staticmethod
+    def get_bias_analysis_prompt(text: str, language: str = "Dutch") -> Tuple[str, str]:
+        """Generate (system, user) prompts for analyzing biased language."""
+        return PromptTemplates._bias_system_prompt(language), text
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _bias_system_prompt(language: str) -> str:
+        """Build the bias analysis system prompt, once per language."""
+        return (
+            PromptTemplates._get_system_preamble(language)
+            + _BIAS_TASK
+            + _json_format(biased_adjectives=_BIAS_ITEM)
+            + 'Als er geen biased bijvoeglijke naamwoorden zijn gevonden, geef dan: {"biased_adjectives": []}'
+        )
+
+    @staticmethod
+    def get_sentiment_analysis_prompt(text: str, language: str = "Dutch") -> Tuple[str, str]:
+        """Generate (system, user) prompts for analyzing sentiment towards entities."""
+        return PromptTemplates._sentiment_system_prompt(language), text
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _sentiment_system_prompt(language: str) -> str:
+        """Build the sentiment analysis system prompt, once per language."""
+        return (
+            PromptTemplates._get_system_preamble(language)
+            + _SENTIMENT_TASK
+            + _json_format(entity_sentiments=_SENTIMENT_ITEM)
+            + 'Als er geen entiteiten zijn gevonden, geef dan: {"entity_sentiments": []}'
+        )
+
+    @staticmethod
+    def get_combined_analysis_prompt(text: str, language: str = "Dutch") -> Tuple[str, str]:
+        """Generate (system, user) prompts for running the question, bias and sentiment analyses at once."""
+        return PromptTemplates._combined_system_prompt(language), text
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _combined_system_prompt(language: str) -> str:
+        """Build the combined analysis system prompt, once per language."""
+        return (
+            PromptTemplates._get_system_preamble(language)
+            + """
+        Voer de volgende drie analyses uit op de tekst.
+"""
+            + "\n        1. Vragen:" + _QUESTION_TASK
+            + "\n        2. Biased taalgebruik:" + _BIAS_TASK
+            + "\n        3. Sentiment:" + _SENTIMENT_TASK
+            + _json_format(
+                questions=_QUESTION_ITEM,
+                biased_adjectives=_BIAS_ITEM,
+                entity_sentiments=_SENTIMENT_ITEM
+            )
+            + 'Geef een lege lijst voor elke analyse zonder resultaten, bijvoorbeeld: '
+            + '{"questions": [], "biased_adjectives": [], "entity_sentiments": []}'
+        )
 
     @staticmethod
     def get_summary_prompt(analysis_results: Dict[str, Any], language: str = "Dutch") -> str:
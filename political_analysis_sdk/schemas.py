@@ -0,0 +1,95 @@
+"""
+Response schemas for structured LLM output.
+
+These pydantic models describe the JSON the analysis prompts ask for. They are
+passed to litellm as ``response_format`` so providers that support structured
+output return JSON matching the schema, and are used to validate the response.
+The items are validated directly into the public result dataclasses, so a
+response is parsed, validated and converted in a single pass.
+
+Not every provider enforces the schema, so validation is lenient: missing result
+arrays are empty, missing item fields take the dataclass defaults and an invalid
+item is skipped instead of rejecting the whole response.
+"""
+
+import logging
+from typing import Annotated, Any, Dict, List, Type
+
+from litellm.utils import type_to_response_format_param
+from pydantic import BaseModel, BeforeValidator, TypeAdapter, ValidationError
+
+from political_analysis_sdk.models import BiasAnalysis, QuestionAnalysis, SentimentAnalysis
+
+logger = logging.getLogger(__name__)
+
+
+def _valid_items(item_type: Type[Any]) -> BeforeValidator:
+    """Validator of a result array that keeps only the items that validate as ``item_type``."""
+    adapter = TypeAdapter(item_type)
+
+    def validate(items: Any) -> Any:
+        if not isinstance(items, list):
+            return items
+
+        valid = []
+        for item in items:
+            try:
+                valid.append(adapter.validate_python(item))
+            except ValidationError as e:
+                logger.warning(f"Skipping invalid {item_type.__name__} item: {e}")
+        return valid
+
+    return BeforeValidator(validate)
+
+
+Questions = Annotated[List[QuestionAnalysis], _valid_items(QuestionAnalysis)]
+Biases = Annotated[List[BiasAnalysis], _valid_items(BiasAnalysis)]
+Sentiments = Annotated[List[SentimentAnalysis], _valid_items(SentimentAnalysis)]
+
+
+class QuestionsPayload(BaseModel):
+    """LLM response for the question analysis."""
+    questions: Questions = []
+
+
+class BiasPayload(BaseModel):
+    """LLM response for the bias analysis."""
+    biased_adjectives: Biases = []
+
+
+class SentimentPayload(BaseModel):
+    """LLM response for the sentiment analysis."""
+    entity_sentiments: Sentiments = []
+
+
+class CombinedPayload(BaseModel):
+    """LLM response for the combined question, bias and sentiment analysis."""
+    questions: Questions = []
+    biased_adjectives: Biases = []
+    entity_sentiments: Sentiments = []
+
+
+# JSON schema ``response_format`` of every payload, generated once instead of on every call
+RESPONSE_FORMATS: Dict[Type[BaseModel], Dict[str, Any]] = {
+    payload: type_to_response_format_param(payload)
+    for payload in (QuestionsPayload, BiasPayload, SentimentPayload, CombinedPayload)
+}
+
+
+def parse_payload(response_model: Type[BaseModel], content: str) -> BaseModel:
+    """
+    Validate an LLM response against a payload schema.
+
+    Responses that wrap the JSON object in prose or a Markdown code fence are
+    validated from the first ``{`` to the last ``}``.
+
+    Raises:
+        ValidationError: if the response contains no valid JSON object
+    """
+    try:
+        return response_model.model_validate_json(content)
+    except ValidationError:
+        start, end = content.find("{"), content.rfind("}") + 1
+        if start == -1 or end <= start or (start, end) == (0, len(content)):
+            raise
+        return response_model.model_validate_json(content[start:end])
@@ -0,0 +1,80 @@
+"""
+Incremental parsing of streamed LLM JSON responses.
+"""
+
+import json
+import re
+from typing import Any, List, Optional
+
+
+class JSONArrayStreamParser:
+    """
+    Incrementally extract the items of a JSON array from streamed text.
+
+    Feed response chunks as they arrive; every call returns the items of the
+    ``"<key>": [...]`` array that have been completed since the previous call.
+    """
+
+    _SEPARATORS = " \t\r\n,"
+
+    def __init__(self, key: str):
+        """
+        Initialize the parser.
+
+        Args:
+            key: Name of the array whose items should be extracted (e.g. "questions")
+        """
+        self.key = key
+        self._key_pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position: Optional[int] = None
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the end of the array has been reached."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        Add a chunk of response text and return the newly completed items.
+
+        Args:
+            chunk: Next piece of streamed response content
+
+        Returns:
+            Items of the array that were completed by this chunk
+        """
+        if self._done:
+            return []
+        self._buffer += chunk
+
+        if self._position is None:
+            match = self._key_pattern.search(self._buffer)
+            if not match:
+                return []
+            self._position = match.end()
+
+        items = []
+        buffer = self._buffer
+        while True:
+            position = self._position
+            while position < len(buffer) and buffer[position] in self._SEPARATORS:
+                position += 1
+            if position >= len(buffer):
+                break
+            if buffer[position] == "]":
+                self._done = True
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # The item is still incomplete, wait for more content
+                break
+
+            items.append(item)
+            self._position = end
+
+        return items
@@ -1,6 +1,7 @@
 from political_analysis_sdk.utils.srt_to_text import (
     parse_srt_file,
+    parse_srt_files,
     save_text_file,
 )
 
-__all__ = ["parse_srt_file", "save_text_file"]
+__all__ = ["parse_srt_file", "parse_srt_files", "save_text_file"]
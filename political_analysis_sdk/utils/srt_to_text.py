@@ -5,9 +5,30 @@ Extracts only the text content, removing timestamps and subtitle numbers.
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Optional, Sequence, Union
+
+
+def _extract_text_lines(lines: Iterable[str]) -> List[str]:
+    """
+    Keep only the subtitle text lines of an SRT file.
+
+    SRT format: number, timestamp, text, blank line (repeats).
+    """
+    text_lines: List[str] = []
+    for line in lines:
+        line = line.strip()
+
+        # Skip empty lines, subtitle numbers and timestamp lines (contain -->)
+        if not line or line.isdigit() or '-->' in line:
+            continue
+
+        text_lines.append(line)
+
+    return text_lines
 
 
 def parse_srt_file(srt_path: Path) -> str:
@@ -26,67 +47,43 @@ def parse_srt_file(srt_path: Path) -> str:
     if not srt_path.exists():
         raise FileNotFoundError(f"SRT file not found: {srt_path}")
 
-    text_lines: List[str] = []
-
+    # Stream the lines so only the extracted text is held in memory
     try:
-        with open(srt_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-
-        # SRT format: number, timestamp, text, blank line (repeats)
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Skip subtitle number
-            if line.isdigit():
-                i += 1
-                continue
-
-            # Skip timestamp line (contains -->)
-            if '-->' in line:
-                i += 1
-                continue
-
-            # Skip empty lines
-            if not line:
-                i += 1
-                continue
-
-                        # This should be text content
-            text_lines.append(line)
-            i += 1
+        with open(srt_path, 'r', encoding='utf-8-sig') as file:
+            text_lines = _extract_text_lines(file)
 
     except UnicodeDecodeError:
-        # Try with different encoding if UTF-8 fails
-        try:
-            with open(srt_path, 'r', encoding='latin-1') as file:
-                lines = file.readlines()
+        # Read as latin-1 if UTF-8 fails, which accepts any byte sequence
+        with open(srt_path, 'r', encoding='latin-1') as file:
+            text_lines = _extract_text_lines(file)
 
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
+    # Merge all text lines into one continuous string
+    merged_text = ' '.join(text_lines)
+    return merged_text
 
-                if line.isdigit():
-                    i += 1
-                    continue
 
-                if '-->' in line:
-                    i += 1
-                    continue
+def parse_srt_files(srt_paths: Sequence[Union[str, Path]], max_workers: Optional[int] = None) -> List[str]:
+    """
+    Parse many SRT files, spreading them over worker processes.
 
-                if not line:
-                    i += 1
-                    continue
+    The line filter is CPU-bound Python, so bulk conversions scale with processes
+    rather than threads. Small batches are parsed in this process.
 
-                text_lines.append(line)
-                i += 1
+    Args:
+        srt_paths: Paths to the SRT files
+        max_workers: Maximum number of worker processes (default: number of CPUs)
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to read SRT file with multiple encodings: {e}")
+    Returns:
+        Merged text content of every file, in the order of ``srt_paths``
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(srt_paths))
+    if workers < 2:
+        return [parse_srt_file(Path(srt_path)) for srt_path in srt_paths]
 
-    # Merge all text lines into one continuous string
-    merged_text = ' '.join(text_lines)
-    return merged_text
+    # Hand out files in batches to amortize the inter-process overhead
+    chunksize = max(1, len(srt_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_srt_file, map(Path, srt_paths), chunksize=chunksize))
 
 
 def save_text_file(text_content: str, output_path: Path) -> None:
@@ -114,19 +111,21 @@ Examples:
   python srt_to_text.py input.srt                    # Convert to input.txt
   python srt_to_text.py input.srt -o output.txt      # Specify output file
   python srt_to_text.py input.srt --stdout           # Print to stdout
+  python srt_to_text.py srt/*.srt --workers 8        # Convert many files in parallel
         """
     )
 
     parser.add_argument(
-        'input_file',
+        'input_files',
         type=str,
-        help='Input SRT file path'
+        nargs='+',
+        help='Input SRT file path(s)'
     )
 
     parser.add_argument(
         '-o', '--output',
         type=str,
-        help='Output text file path (default: input_file.txt)'
+        help='Output text file path, for a single input file (default: input_file.txt)'
     )
 
     parser.add_argument(
@@ -135,32 +134,43 @@ Examples:
         help='Print output to stdout instead of saving to file'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for converting many files (default: number of CPUs)'
+    )
+
     args = parser.parse_args()
 
+    if args.output and len(args.input_files) > 1:
+        parser.error("--output can only be used with a single input file")
+
     try:
-        # Parse input file
-        input_path = Path(args.input_file)
-        text_content = parse_srt_file(input_path)
-
-        if not text_content:
-            print("Warning: No text content found in SRT file", file=sys.stderr)
-            return
-
-        # Handle output
-        if args.stdout:
-            # Print to stdout
-            print(text_content)
-        else:
-            # Save to file
-            if args.output:
-                output_path = Path(args.output)
-            else:
-                # Default: replace .srt with .txt
-                output_path = input_path.with_suffix('.txt')
+        # Parse input files
+        input_paths = [Path(input_file) for input_file in args.input_files]
+        text_contents = parse_srt_files(input_paths, max_workers=args.workers)
+
+        for input_path, text_content in zip(input_paths, text_contents):
+            if not text_content:
+                print(f"Warning: No text content found in SRT file {input_path}", file=sys.stderr)
+                continue
 
-            save_text_file(text_content, output_path)
-            print(f"Successfully converted {input_path} to {output_path}")
-            print(f"Extracted {len(text_content.split())} words")
+            # Handle output
+            if args.stdout:
+                # Print to stdout
+                print(text_content)
+            else:
+                # Save to file
+                if args.output:
+                    output_path = Path(args.output)
+                else:
+                    # Default: replace .srt with .txt
+                    output_path = input_path.with_suffix('.txt')
+
+                save_text_file(text_content, output_path)
+                print(f"Successfully converted {input_path} to {output_path}")
+                print(f"Extracted {len(text_content.split())} words")
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
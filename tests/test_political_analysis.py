@@ -2,27 +2,48 @@
 Basic tests for the Political Statement Analysis SDK.
 """
 
+import asyncio
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
+import litellm
+import orjson
 import pytest
+from pydantic import ValidationError
+from tenacity import wait_none
 
 # Add the parent directory to the path so we can import the SDK
 sys.path.append(str(Path(__file__).parent.parent))
 
-from political_analysis_sdk import PoliticalStatementAnalyzer
-from political_analysis_sdk.models import QuestionType, SentimentType
+from political_analysis_sdk import PoliticalStatementAnalyzer, ResponseCache, SemanticCache, cli
+from political_analysis_sdk.models import (
+    BiasAnalysis,
+    QuestionAnalysis,
+    QuestionType,
+    SentimentAnalysis,
+    SentimentType,
+)
+from political_analysis_sdk.prompts import PromptTemplates
+from political_analysis_sdk.schemas import QuestionsPayload, SentimentPayload, parse_payload
+from political_analysis_sdk.streaming import JSONArrayStreamParser
+from political_analysis_sdk.utils import parse_srt_file, parse_srt_files
+
+
+@pytest.fixture(scope="module")
+def default_analyzer():
+    """Analyzer with the default settings, shared by the tests of this module."""
+    return PoliticalStatementAnalyzer()
 
 
 class TestPoliticalStatementAnalyzer:
     """Test class for the PoliticalStatementAnalyzer."""
     
-    def test_analyzer_initialization(self):
+    def test_analyzer_initialization(self, default_analyzer):
         """Test that the analyzer can be initialized."""
-        analyzer = PoliticalStatementAnalyzer()
-        assert analyzer.model_name == "gpt-4"
-        assert analyzer.language == "Dutch"
-        assert analyzer.temperature == 0.1
+        assert default_analyzer.model_name == "gpt-4"
+        assert default_analyzer.language == "Dutch"
+        assert default_analyzer.temperature == 0.1
     
     def test_analyzer_with_custom_params(self):
         """Test analyzer initialization with custom parameters."""
@@ -49,6 +70,663 @@ class TestPoliticalStatementAnalyzer:
         assert SentimentType.NEUTRAL == "neutral"
         assert SentimentType.MIXED == "mixed"
 
+    def test_chunks_overlap_by_trailing_sentences(self):
+        """Test that long texts are chunked with the previous chunk's last sentences repeated."""
+        analyzer = PoliticalStatementAnalyzer(chunk_tokens=40, chunk_overlap=15)
+        sentences = [f"Dit is zin nummer {number} van de tekst." for number in range(6)]
+        chunks = analyzer._chunk_text(" ".join(sentences))
+        assert len(chunks) > 1
+        assert chunks[0][1] == ""
+        for (previous, _), (chunk, overlap) in zip(chunks, chunks[1:]):
+            assert chunk.split(". ")[0] in previous
+            assert overlap and chunk.startswith(overlap) and previous.endswith(overlap)
+        assert sentences[-1] in chunks[-1][0]
+
+    def test_merge_only_dedupes_findings_in_the_overlap(self, default_analyzer):
+        """Test that a question is merged only when it was repeated by the chunk overlap."""
+        def questions(*texts):
+            return [QuestionAnalysis(text, QuestionType.CRITICAL, 0.9, "r", "c") for text in texts], [], []
+
+        overlapping = [("Waarom nu? Wat kost het?", ""), ("Wat kost het? En waarom nu?", "Wat kost het?")]
+        merged, _, _ = default_analyzer._merge_analyses(
+            overlapping, [questions("Waarom nu?", "Wat kost het?"), questions("Wat kost het?", "Waarom nu?")]
+        )
+        assert [q.question_text for q in merged] == ["Waarom nu?", "Wat kost het?", "Waarom nu?"]
+
+        # Without overlap, a question asked in both chunks is asked twice
+        separate = [("Wat kost het?", ""), ("Wat kost het?", "")]
+        merged, _, _ = default_analyzer._merge_analyses(
+            separate, [questions("Wat kost het?"), questions("Wat kost het?")]
+        )
+        result = default_analyzer._assemble_result("direct_text_input", merged, [], [])
+        assert (result.total_questions, result.critical_questions) == (2, 2)
+
+    def test_overlap_matches_whole_words_only(self, default_analyzer):
+        """Test that a finding is only recognized in the overlap on word boundaries."""
+        def biases(*adjectives):
+            return [], [BiasAnalysis(adjective, "Rutte", "negative", 0.8, "r", "c") for adjective in adjectives], []
+
+        chunks = [("Rutte is slecht.", ""), ("Een slechte zaak. Rutte is slecht.", "Een slechte zaak.")]
+        _, merged, _ = default_analyzer._merge_analyses(chunks, [biases("slecht"), biases("slecht")])
+        assert len(merged) == 2
+
+        chunks = [("Rutte is slecht.", ""), ("Rutte is slecht. Maar goed.", "Rutte is slecht.")]
+        _, merged, _ = default_analyzer._merge_analyses(chunks, [biases("slecht"), biases("slecht")])
+        assert len(merged) == 1
+
+    def test_entity_sentiments_are_merged_across_chunks(self, default_analyzer):
+        """Test that an entity keeps its most confident sentiment, wherever in the text it was found."""
+        def sentiments(*entities):
+            return [], [], [
+                SentimentAnalysis(name, kind, SentimentType.NEGATIVE, confidence) for name, kind, confidence in entities
+            ]
+
+        chunks = [("De VVD en Rutte.", ""), ("Iets anders.", ""), ("Weer de VVD.", "")]
+        _, _, merged = default_analyzer._merge_analyses(chunks, [
+            sentiments(("VVD", "party", 0.6), ("Rutte", "person", 0.9)),
+            sentiments(),
+            sentiments(("vvd", "party", 0.8), ("VVD", "company", 0.5)),
+        ])
+        assert [(s.entity_name, s.entity_type, s.confidence) for s in merged] == [
+            ("vvd", "party", 0.8), ("Rutte", "person", 0.9), ("VVD", "company", 0.5)
+        ]
+
+    def test_embeddings_are_bounded(self, monkeypatch, tmp_path):
+        """Test that only the most recently used text embeddings are kept."""
+        calls = []
+
+        def embedding(model, input):
+            calls.append(input[0])
+            return SimpleNamespace(data=[{"embedding": [float(len(input[0]))]}])
+
+        monkeypatch.setattr("litellm.embedding", embedding)
+        monkeypatch.setattr("political_analysis_sdk.core._EMBEDDING_CACHE_SIZE", 2)
+        analyzer = PoliticalStatementAnalyzer(cache_dir=str(tmp_path), semantic_cache_threshold=0.95)
+
+        for text in ["een", "twee", "een", "drie", "een", "twee"]:
+            analyzer._embed(text)
+
+        assert len(analyzer._embeddings) == 2
+        assert calls == ["een", "twee", "drie", "twee"]
+
+
+def completion(content: str) -> SimpleNamespace:
+    """Non-streamed completion with the given response content."""
+    return SimpleNamespace(usage=None, choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def stream_chunk(content: str) -> SimpleNamespace:
+    """Streamed completion chunk carrying a piece of the response content."""
+    return SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class TestLLMRetries:
+    """Test class for the retries of LLM calls."""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        """Retry immediately instead of waiting."""
+        monkeypatch.setattr(PoliticalStatementAnalyzer._request_completion.retry, "wait", wait_none())
+
+    def test_invalid_cache_entry_is_evicted_and_requested_once(self, monkeypatch, tmp_path):
+        """Test that a cached response failing validation is replaced by one fresh completion."""
+        analyzer = PoliticalStatementAnalyzer(cache_dir=str(tmp_path))
+        system_prompt, prompt = PromptTemplates.get_question_analysis_prompt("Waarom nu?")
+        cache_key = ResponseCache.make_key("gpt-4", 0.1, analyzer._build_messages(prompt, system_prompt))
+        analyzer.cache.set(cache_key, '{"questions": "Waarom nu?"}')
+
+        calls = []
+        valid = orjson.dumps({"questions": [question("Waarom nu?")]}).decode()
+        monkeypatch.setattr(analyzer, "_request_completion", lambda *args: calls.append(args) or valid)
+
+        payload = analyzer._run_llm(prompt, system_prompt, QuestionsPayload)
+
+        assert [q.question_text for q in payload.questions] == ["Waarom nu?"]
+        assert len(calls) == 1
+        assert analyzer.cache.get(cache_key) == valid
+
+    def test_retry_does_not_report_streamed_items_again(self, monkeypatch):
+        """Test that items streamed by an invalid response are not reported again by its retry."""
+        first, second = question("Waarom nu?"), question("Klopt dat?", "confirming")
+        attempts = iter([
+            # Truncated response: the first item is streamed, then validation fails
+            [stream_chunk('{"questions": [' + orjson.dumps(first).decode() + ', {"quest')],
+            [stream_chunk(orjson.dumps({"questions": [first, second]}).decode())],
+        ])
+        monkeypatch.setattr("litellm.completion", lambda **kwargs: iter(next(attempts)))
+
+        reported = []
+        analyzer = PoliticalStatementAnalyzer(
+            api_key="test-key", stream=True, on_stream_item=lambda key, item: reported.append(item["question"])
+        )
+        questions = analyzer._analyze(analyzer._analyses()[0], "Waarom nu? Klopt dat?")
+
+        assert [q.question_text for q in questions] == ["Waarom nu?", "Klopt dat?"]
+        assert reported == ["Waarom nu?", "Klopt dat?"]
+
+    def test_invalid_response_is_requested_only_once_more(self, monkeypatch):
+        """Test that a response failing validation gets one immediate retry, not the transient backoff."""
+        calls = []
+        monkeypatch.setattr(
+            "litellm.completion", lambda **kwargs: calls.append(kwargs) or completion("Ik weet het niet.")
+        )
+
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key")
+        assert analyzer._analyze(analyzer._analyses()[0], "Waarom nu?") == []
+        assert len(calls) == 2
+
+    def test_transient_errors_are_retried(self, monkeypatch):
+        """Test that rate limits are retried until the provider answers."""
+        valid = orjson.dumps({"questions": [question("Waarom nu?")]}).decode()
+        responses = iter([litellm.RateLimitError("slow down", "openai", "gpt-4"), completion(valid)])
+
+        def fake_completion(**kwargs):
+            response = next(responses)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr("litellm.completion", fake_completion)
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key")
+        questions = analyzer._analyze(analyzer._analyses()[0], "Waarom nu?")
+        assert [q.question_text for q in questions] == ["Waarom nu?"]
+
+
+class TestAsyncAnalysis:
+    """Test class for the async analysis methods."""
+
+    @pytest.fixture
+    def acompletion(self, monkeypatch):
+        """Fake litellm.acompletion that answers the question and bias analyses and the summary."""
+        calls = []
+
+        async def acompletion(messages, **kwargs):
+            calls.append(kwargs["client"])
+            system_prompt = messages[0]["content"] if len(messages) > 1 else ""
+            if '"entity_sentiments"' in system_prompt:
+                raise litellm.AuthenticationError("Invalid API key", "openai", "gpt-4")
+            if '"biased_adjectives"' in system_prompt:
+                return completion('{"biased_adjectives": []}')
+            if '"questions"' in system_prompt:
+                return completion(orjson.dumps({"questions": [question(messages[-1]["content"])]}).decode())
+            return completion("Samenvatting.")
+
+        monkeypatch.setattr("litellm.acompletion", acompletion)
+        return calls
+
+    def test_concurrent_calls_share_one_client_closed_afterwards(self, acompletion):
+        """Test that gathered calls are analyzed and summarized, and their client is closed when they finish."""
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key")
+
+        async def analyze_both():
+            return await asyncio.gather(analyzer.aanalyze_text("Waarom nu?"), analyzer.aanalyze_text("Klopt dat?"))
+
+        first, second = asyncio.run(analyze_both())
+
+        assert [q.question_text for q in first.question_analysis] == ["Waarom nu?"]
+        assert [q.question_text for q in second.question_analysis] == ["Klopt dat?"]
+        # The failing sentiment analysis is reported as empty without affecting the others
+        assert first.entity_sentiments == [] and second.entity_sentiments == []
+        assert first.summary == second.summary == "Samenvatting."
+
+        assert len(acompletion) == 8 and len(set(map(id, acompletion))) == 1
+        assert acompletion[0].is_closed()
+        assert len(analyzer._async_llm_clients) == 0
+
+    def test_every_asyncio_run_closes_its_client(self, acompletion, tmp_path):
+        """Test that separate asyncio.run calls each get a client that is closed at the end of the call."""
+        text_file = tmp_path / "interview.txt"
+        text_file.write_text("Waarom nu?", encoding="utf-8")
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key")
+
+        for _ in range(2):
+            result = asyncio.run(analyzer.aanalyze_text_file(str(text_file), include_summary=False))
+            assert [q.question_text for q in result.question_analysis] == ["Waarom nu?"]
+            assert result.summary == ""
+
+        assert len(acompletion) == 6 and acompletion[0] is not acompletion[-1]
+        assert all(client.is_closed() for client in acompletion)
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(analyzer.aanalyze_text_file(str(tmp_path / "missing.txt")))
+
+    def test_async_context_manager_keeps_the_client_open(self, acompletion):
+        """Test that calls inside ``async with`` reuse one client, closed when the block ends."""
+        async def analyze_twice():
+            async with PoliticalStatementAnalyzer(api_key="test-key") as analyzer:
+                await analyzer.aanalyze_text("Waarom nu?", include_summary=False)
+                assert not acompletion[-1].is_closed()
+                await analyzer.aanalyze_text("Klopt dat?", include_summary=False)
+
+        asyncio.run(analyze_twice())
+
+        assert len(set(map(id, acompletion))) == 1
+        assert acompletion[0].is_closed()
+
+    def test_failed_analysis_returns_an_error_result(self, acompletion, monkeypatch):
+        """Test that an unexpected error in aanalyze_text is reported in the result."""
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key")
+        monkeypatch.setattr(analyzer, "_chunk_text", lambda text: 1 / 0)
+
+        result = asyncio.run(analyzer.aanalyze_text("Waarom nu?"))
+
+        assert result.total_questions == 0
+        assert result.metadata["error"] == "division by zero"
+        assert acompletion == []
+
+
+class TestResponseCache:
+    """Test class for the ResponseCache."""
+
+    def test_cache_roundtrip(self, tmp_path):
+        """Test that stored responses are returned for the same request."""
+        cache = ResponseCache(tmp_path)
+        messages = [{"role": "user", "content": "Wat vindt u daarvan?"}]
+        key = ResponseCache.make_key("gpt-4", 0.1, messages)
+
+        assert cache.get(key) is None
+        cache.set(key, '{"questions": []}')
+        assert cache.get(key) == '{"questions": []}'
+
+    def test_cache_key_depends_on_settings(self):
+        """Test that model and temperature are part of the cache key."""
+        messages = [{"role": "user", "content": "Tekst"}]
+        key = ResponseCache.make_key("gpt-4", 0.1, messages)
+        assert key != ResponseCache.make_key("gpt-4o", 0.1, messages)
+        assert key != ResponseCache.make_key("gpt-4", 0.5, messages)
+
+
+class TestSemanticCache:
+    """Test class for the SemanticCache."""
+
+    def test_similar_embeddings_hit(self, tmp_path):
+        """Test that only sufficiently similar texts reuse a stored response."""
+        cache = SemanticCache(tmp_path, threshold=0.95)
+        cache.set("questions", [1.0, 0.0, 0.0], '{"questions": []}')
+
+        assert cache.get("questions", [0.99, 0.05, 0.0]) == '{"questions": []}'
+        assert cache.get("questions", [0.0, 1.0, 0.0]) is None
+        assert cache.get("biased_adjectives", [1.0, 0.0, 0.0]) is None
+
+        # Entries are persisted and reloaded by a new cache instance
+        assert SemanticCache(tmp_path).get("questions", [2.0, 0.0, 0.0]) == '{"questions": []}'
+
+
+def batch_output_line(custom_id: str, payload: dict, status_code: int = 200) -> bytes:
+    """Line of a Batch API output file answering one request."""
+    body = {"choices": [{"message": {"content": orjson.dumps(payload).decode()}}]}
+    if status_code != 200:
+        body = {"error": {"message": "Internal server error"}}
+    return orjson.dumps({"custom_id": custom_id, "response": {"status_code": status_code, "body": body}})
+
+
+def question(text: str, question_type: str = "critical") -> dict:
+    """Question item of an LLM response."""
+    return {"question": text, "type": question_type, "confidence": 0.9, "reasoning": "r", "context": "c"}
+
+
+def sentiment(entity_name: str, entity_type: str = "party") -> dict:
+    """Entity sentiment item of an LLM response."""
+    return {
+        "entity_name": entity_name, "entity_type": entity_type, "sentiment": "negative",
+        "confidence": 0.8, "reasoning": "r", "context": "c", "supporting_quotes": []
+    }
+
+
+def fake_response(messages: list) -> str:
+    """
+    Answer of a fake model to an analysis or summary prompt.
+
+    Every sentence ending in "?" is a critical question and the VVD, when mentioned,
+    is a negative entity; only the result arrays the system prompt asks for are returned.
+    """
+    system_prompt = messages[0]["content"] if len(messages) > 1 else ""
+    text = messages[-1]["content"]
+    results = {
+        "questions": [question(sentence.strip() + "?") for sentence in text.split("?")[:-1]],
+        "biased_adjectives": [],
+        "entity_sentiments": [sentiment("VVD")] if "VVD" in text else [],
+    }
+    keys = [key for key in results if f'"{key}"' in system_prompt]
+    if not keys:
+        return "Samenvatting."
+    return orjson.dumps({key: results[key] for key in keys}).decode()
+
+
+@pytest.fixture
+def completion_calls(monkeypatch):
+    """Fake litellm.completion answering with fake_response; returns the messages of every call."""
+    calls = []
+
+    def fake_completion(messages, **kwargs):
+        calls.append(messages)
+        return completion(fake_response(messages))
+
+    monkeypatch.setattr("litellm.completion", fake_completion)
+    return calls
+
+
+class TestAnalyzeMany:
+    """Test class for analyzing many texts and files at once."""
+
+    def test_analyze_batch_keeps_the_input_order(self, completion_calls):
+        """Test that every text is analyzed and summarized, and results are returned in input order."""
+        texts = ["Waarom nu?", "De VVD zegt dit.", "Klopt dat? En waarom?"]
+        results = PoliticalStatementAnalyzer(api_key="test-key").analyze_batch(texts, max_concurrency=4)
+
+        assert [[q.question_text for q in result.question_analysis] for result in results] == [
+            ["Waarom nu?"], [], ["Klopt dat?", "En waarom?"]
+        ]
+        assert [s.entity_name for s in results[1].entity_sentiments] == ["VVD"]
+        assert [result.summary for result in results] == ["Samenvatting."] * 3
+        assert len(completion_calls) == 3 * 3 + 3
+
+    def test_analyze_text_files(self, completion_calls, tmp_path):
+        """Test that files are analyzed under their own path, and a missing file is reported up front."""
+        paths = []
+        for name, text in [("a.txt", "Waarom nu?"), ("b.txt", "Geen vragen.")]:
+            (tmp_path / name).write_text(text, encoding="utf-8")
+            paths.append(str(tmp_path / name))
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key")
+
+        first, second = analyzer.analyze_text_files(paths, include_summary=False)
+
+        assert (first.text_file_path, first.total_questions) == (paths[0], 1)
+        assert (second.text_file_path, second.total_questions) == (paths[1], 0)
+
+        completion_calls.clear()
+        with pytest.raises(FileNotFoundError):
+            analyzer.analyze_text_files(paths + [str(tmp_path / "c.txt")])
+        assert completion_calls == []
+
+
+class TestPromptCaching:
+    """Test class for the split of the prompts into a cacheable system prefix and the text."""
+
+    def test_text_is_sent_after_a_shared_system_prompt(self, completion_calls):
+        """Test that only the user message differs between texts and the system prompt is marked cacheable."""
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key")
+        analyzer.analyze_batch(["Waarom nu?", "Klopt dat?"], max_concurrency=1, include_summary=False)
+
+        system_prompts = {}
+        for system_message, user_message in completion_calls:
+            assert system_message["role"] == "system"
+            assert system_message["cache_control"] == {"type": "ephemeral"}
+            assert "Waarom nu?" not in system_message["content"]
+            assert user_message == {"role": "user", "content": user_message["content"]}
+            system_prompts.setdefault(system_message["content"], []).append(user_message["content"])
+
+        assert len(system_prompts) == 3
+        assert all(sorted(texts) == ["Klopt dat?", "Waarom nu?"] for texts in system_prompts.values())
+
+
+class TestSinglePass:
+    """Test class for the single-pass combined analysis."""
+
+    def test_one_call_returns_all_analyses(self, completion_calls):
+        """Test that questions, biases and sentiments come from one combined call."""
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key", single_pass=True)
+        result = analyzer.analyze_text("Waarom zegt de VVD dit?", include_summary=False)
+
+        assert [q.question_text for q in result.question_analysis] == ["Waarom zegt de VVD dit?"]
+        assert [s.entity_name for s in result.entity_sentiments] == ["VVD"]
+        assert result.biased_adjectives == []
+        assert len(completion_calls) == 1
+        assert all(f'"{key}"' in completion_calls[0][0]["content"] for key in (
+            "questions", "biased_adjectives", "entity_sentiments"
+        ))
+
+    def test_batch_makes_one_call_per_text(self, completion_calls):
+        """Test that analyze_batch sends each text once in single-pass mode."""
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key", single_pass=True)
+        results = analyzer.analyze_batch(["Waarom nu?", "Klopt dat?"], include_summary=False)
+        assert [result.total_questions for result in results] == [1, 1]
+        assert len(completion_calls) == 2
+
+
+class TestSummary:
+    """Test class for the summary of the analysis results."""
+
+    def test_summary_can_be_skipped(self, completion_calls):
+        """Test that include_summary=False skips the summary call."""
+        result = PoliticalStatementAnalyzer(api_key="test-key").analyze_text("Waarom nu?", include_summary=False)
+        assert result.total_questions == 1
+        assert result.summary == ""
+        assert len(completion_calls) == 3
+
+    def test_nothing_to_summarize_skips_the_llm(self, completion_calls):
+        """Test that a text without findings gets the fixed summary without a summary call."""
+        result = PoliticalStatementAnalyzer(api_key="test-key").analyze_text("Geen vragen.")
+        assert result.summary == "Geen vragen, biased taalgebruik of entiteiten gevonden om samen te vatten."
+        assert len(completion_calls) == 3
+
+    def test_findings_are_summarized(self, completion_calls):
+        """Test that the summary is requested once, after the analyses."""
+        result = PoliticalStatementAnalyzer(api_key="test-key").analyze_text("Waarom nu?")
+        assert result.summary == "Samenvatting."
+        assert len(completion_calls) == 4
+        assert [message["role"] for message in completion_calls[-1]] == ["user"]
+
+
+class TestCLI:
+    """Test class for the command-line interface."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_analyzers(self):
+        """Do not share analyzers between tests."""
+        cli.get_analyzer.cache_clear()
+        yield
+        cli.get_analyzer.cache_clear()
+
+    def test_expand_file_patterns(self, tmp_path, monkeypatch):
+        """Test that patterns expand to sorted, de-duplicated existing files."""
+        monkeypatch.chdir(tmp_path)
+        for name in ["b.txt", "a.txt", "c.srt"]:
+            Path(name).write_text("Tekst", encoding="utf-8")
+        Path("dir.txt").mkdir()
+
+        assert cli.expand_file_patterns(["*.txt", "a.txt", "c.srt", "missing.txt", "*.json"]) == [
+            "a.txt", "b.txt", "c.srt"
+        ]
+
+    def test_analyze_batch_command(self, completion_calls, tmp_path, monkeypatch, capsys):
+        """Test that analyze-batch analyzes every matching file and saves the results as a JSON list."""
+        (tmp_path / "a.txt").write_text("Waarom nu?", encoding="utf-8")
+        (tmp_path / "b.txt").write_text("De VVD zegt dit.", encoding="utf-8")
+        output = tmp_path / "results.json"
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(sys, "argv", [
+            "cli", "analyze-batch", str(tmp_path / "*.txt"), "--no-summary", "--output", str(output)
+        ])
+
+        cli.main()
+
+        results = orjson.loads(output.read_bytes())
+        assert [Path(result["text_file_path"]).name for result in results] == ["a.txt", "b.txt"]
+        assert [result["total_questions"] for result in results] == [1, 0]
+        assert results[1]["entity_sentiments"][0]["entity_name"] == "VVD"
+        assert f"=== {tmp_path / 'a.txt'} ===" in capsys.readouterr().out
+        assert len(completion_calls) == 6
+
+    def test_analyze_batch_without_matches_fails(self, completion_calls, tmp_path, monkeypatch, capsys):
+        """Test that analyze-batch exits with an error when no file matches."""
+        monkeypatch.setattr(sys, "argv", ["cli", "analyze-batch", str(tmp_path / "*.txt")])
+
+        with pytest.raises(SystemExit) as exc_info:
+            cli.main()
+
+        assert exc_info.value.code == 1
+        assert "No files found matching" in capsys.readouterr().out
+        assert completion_calls == []
+
+
+class TestBatchAPI:
+    """Test class for the Batch API analysis."""
+
+    @pytest.fixture
+    def batch(self, monkeypatch):
+        """Fake Batch API that records the submitted requests and answers with the given output lines."""
+        batch = SimpleNamespace(submitted=[], output=b"", errors=b"")
+
+        def create_file(file, purpose, **kwargs):
+            batch.submitted.extend(orjson.loads(line) for line in file[1].splitlines())
+            return SimpleNamespace(id="file-in")
+
+        monkeypatch.setattr("litellm.create_file", create_file)
+        monkeypatch.setattr("litellm.create_batch", lambda **kwargs: SimpleNamespace(
+            id="batch-1", status="completed", output_file_id="file-out", error_file_id="file-err"
+        ))
+        monkeypatch.setattr("litellm.file_content", lambda file_id, **kwargs: SimpleNamespace(
+            content=batch.output if file_id == "file-out" else batch.errors
+        ))
+        return batch
+
+    def test_batch_output_is_matched_to_texts_and_analyses(self, batch):
+        """Test that unordered output lines reach their text and analysis and failed lines are skipped."""
+        batch.output = b"\n".join([
+            batch_output_line(
+                "1:0:question", {"questions": [question("Waarom nu?"), question("Klopt dat?", "confirming")]}
+            ),
+            batch_output_line("1:0:sentiment", {"entity_sentiments": [sentiment("VVD")]}),
+            batch_output_line("0:0:bias", {"biased_adjectives": []}),
+            batch_output_line("0:0:question", {"questions": [question("Wat kost het?", "neutral")]}),
+            batch_output_line("1:0:bias", {"biased_adjectives": []}),
+        ])
+        batch.errors = batch_output_line("0:0:sentiment", {}, status_code=500)
+
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key")
+        first, second = analyzer.analyze_batch_api(
+            ["De VVD zegt dit.", "Waarom nu? Klopt dat?"], include_summary=False
+        )
+
+        assert sorted(request["custom_id"] for request in batch.submitted) == [
+            "0:0:bias", "0:0:question", "0:0:sentiment", "1:0:bias", "1:0:question", "1:0:sentiment"
+        ]
+        assert batch.submitted[0]["body"]["messages"][1]["content"] == "De VVD zegt dit."
+
+        assert [q.question_text for q in first.question_analysis] == ["Wat kost het?"]
+        assert first.entity_sentiments == []
+        assert [q.question_text for q in second.question_analysis] == ["Waarom nu?", "Klopt dat?"]
+        assert (second.critical_questions, second.confirming_questions) == (1, 1)
+        assert [s.entity_name for s in second.entity_sentiments] == ["VVD"]
+
+    @pytest.mark.parametrize("model_name, has_response_format", [("gpt-4", False), ("gpt-4o", True)])
+    def test_response_format_only_for_models_supporting_it(self, batch, model_name, has_response_format):
+        """Test that the JSON schema is only sent to models that accept a response_format."""
+        PoliticalStatementAnalyzer(model_name=model_name, api_key="test-key").analyze_batch_api(
+            ["Waarom nu?"], include_summary=False
+        )
+        assert [("response_format" in request["body"]) for request in batch.submitted] == [has_response_format] * 3
+
+    def test_invalid_cache_entries_are_evicted_and_submitted(self, batch, tmp_path):
+        """Test that only valid cached responses spare a batch request."""
+        analyzer = PoliticalStatementAnalyzer(api_key="test-key", cache_dir=str(tmp_path))
+        cache_keys = {}
+        for name, get_prompts, _, _ in analyzer._analyses():
+            system_prompt, prompt = get_prompts("Waarom nu?", analyzer.language)
+            cache_keys[name] = ResponseCache.make_key("gpt-4", 0.1, analyzer._build_messages(prompt, system_prompt))
+        analyzer.cache.set(cache_keys["question"], orjson.dumps({"questions": [question("Waarom nu?")]}).decode())
+        analyzer.cache.set(cache_keys["bias"], '{"biased_adjectives": "geen"}')
+        batch.output = b"\n".join([
+            batch_output_line("0:0:bias", {"biased_adjectives": []}),
+            batch_output_line("0:0:sentiment", {"entity_sentiments": []}),
+        ])
+
+        result, = analyzer.analyze_batch_api(["Waarom nu?"], include_summary=False)
+
+        assert sorted(request["custom_id"] for request in batch.submitted) == ["0:0:bias", "0:0:sentiment"]
+        assert [q.question_text for q in result.question_analysis] == ["Waarom nu?"]
+        assert analyzer.cache.get(cache_keys["bias"]) == '{"biased_adjectives":[]}'
+
+
+class TestParsePayload:
+    """Test class for the validation of LLM responses."""
+
+    def test_invalid_items_are_skipped_and_missing_fields_defaulted(self):
+        """Test that one bad item does not reject the other items of a response."""
+        content = orjson.dumps({"questions": [
+            {"question": "Waarom nu?", "type": "critical", "confidence": 0.9},
+            {"question": "Wat is dit?", "type": "rhetorical", "confidence": 0.5},
+            {"question": "Klopt dat?"},
+        ]}).decode()
+
+        payload = parse_payload(QuestionsPayload, content)
+
+        assert [(q.question_text, q.question_type) for q in payload.questions] == [
+            ("Waarom nu?", QuestionType.CRITICAL), ("Klopt dat?", QuestionType.NEUTRAL)
+        ]
+        assert (payload.questions[0].reasoning, payload.questions[0].context) == ("", "")
+        assert payload.questions[1].confidence == 0.0
+
+    def test_json_is_extracted_from_surrounding_text(self):
+        """Test that a JSON object wrapped in prose or a code fence is still parsed."""
+        content = 'Hier is de analyse:\n```json\n{"entity_sentiments": [{"entity_name": "VVD"}]}\n```'
+        payload = parse_payload(SentimentPayload, content)
+        assert [(s.entity_name, s.sentiment, s.supporting_quotes) for s in payload.entity_sentiments] == [
+            ("VVD", SentimentType.NEUTRAL, [])
+        ]
+        assert parse_payload(SentimentPayload, "{}").entity_sentiments == []
+
+        with pytest.raises(ValidationError):
+            parse_payload(QuestionsPayload, "Geen vragen gevonden.")
+
+
+SRT = """1
+00:00:00,000 --> 00:00:02,000
+Goedemiddag.
+
+2
+00:00:02,000 --> 00:00:04,500
+Waarom stemt u
+tegen dit voorstel?
+"""
+
+
+class TestSRTParsing:
+    """Test class for the SRT to text conversion."""
+
+    def test_only_subtitle_text_is_kept(self, tmp_path):
+        """Test that numbers, timestamps, blank lines and a UTF-8 BOM are dropped and the text lines merged."""
+        srt_file = tmp_path / "interview.srt"
+        srt_file.write_bytes(SRT.encode("utf-8-sig"))
+        assert parse_srt_file(srt_file) == "Goedemiddag. Waarom stemt u tegen dit voorstel?"
+        assert parse_srt_file(str(srt_file)) == parse_srt_file(srt_file)
+
+    def test_latin1_fallback(self, tmp_path):
+        """Test that a file that is not valid UTF-8 is decoded as latin-1."""
+        srt_file = tmp_path / "interview.srt"
+        srt_file.write_bytes(SRT.replace("Goedemiddag.", "Café-eigenaar.").encode("latin-1"))
+        assert parse_srt_file(srt_file).startswith("Café-eigenaar. Waarom")
+
+        with pytest.raises(FileNotFoundError):
+            parse_srt_file(tmp_path / "missing.srt")
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_parse_srt_files_keeps_the_input_order(self, tmp_path, max_workers):
+        """Test that many files are parsed, in this process or in workers, in the order given."""
+        srt_files = []
+        for number in range(5):
+            srt_file = tmp_path / f"{number}.srt"
+            srt_file.write_text(SRT.replace("Goedemiddag.", f"Fragment {number}."), encoding="utf-8")
+            srt_files.append(str(srt_file))
+
+        texts = parse_srt_files(srt_files[::-1], max_workers=max_workers)
+
+        assert [text.split(" Waarom")[0] for text in texts] == [f"Fragment {n}." for n in range(4, -1, -1)]
+        assert parse_srt_files([], max_workers=max_workers) == []
+
+
+class TestJSONArrayStreamParser:
+    """Test class for the JSONArrayStreamParser."""
+
+    def test_items_are_emitted_as_they_complete(self):
+        """Test that array items are returned once fully streamed."""
+        parser = JSONArrayStreamParser("questions")
+        assert parser.feed('{"questions": [{"question": "Waar') == []
+        assert parser.feed('om [nu]?"}, {"quest') == [{"question": "Waarom [nu]?"}]
+        assert parser.feed('ion": "En?"}]}') == [{"question": "En?"}]
+        assert parser.done
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
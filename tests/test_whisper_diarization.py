@@ -0,0 +1,223 @@
+"""
+Basic tests for the Whisper Diarization SDK.
+"""
+
+import dataclasses
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add the parent directory to the path so we can import the SDK
+sys.path.append(str(Path(__file__).parent.parent))
+
+from whisper_diarization_sdk import (
+    DiarizationConfig,
+    DiarizationResult,
+    SpeakerSegment,
+    TranscriptionSegment,
+    WhisperDiarizer,
+)
+
+
+def make_result() -> DiarizationResult:
+    """Result with two speakers, one of them speaking twice."""
+    speakers = [
+        SpeakerSegment("Speaker 0", 0.0, 1.0, 0.9, "Goedemiddag."),
+        SpeakerSegment("Speaker 1", 1.0, 2.0, 0.8, "Waarom?"),
+        SpeakerSegment("Speaker 0", 2.0, 3.5, 0.7, "Daarom."),
+    ]
+    transcription = [TranscriptionSegment(seg.text, seg.start_time, seg.end_time, seg.confidence) for seg in speakers]
+    return DiarizationResult("interview.wav", speakers, transcription, {})
+
+
+class TestDiarizationConfig:
+    """Test validation of the diarization settings."""
+
+    @pytest.mark.parametrize("precision", ["float16", "bfloat16", "float32"])
+    def test_supported_embedding_precisions(self, precision):
+        """Test that the supported embedding precisions are accepted."""
+        assert DiarizationConfig(embedding_precision=precision).embedding_precision == precision
+
+    def test_unsupported_embedding_precision(self):
+        """Test that an unsupported embedding precision fails at construction."""
+        with pytest.raises(ValueError, match="embedding_precision"):
+            DiarizationConfig(embedding_precision="int8")
+
+
+class TestDiarizationResult:
+    """Test the derived views of a DiarizationResult."""
+
+    def test_speaker_index(self):
+        """Test that segments are grouped per speaker in order of appearance."""
+        result = make_result()
+        assert result.unique_speakers == ["Speaker 0", "Speaker 1"]
+        assert result.get_speaker_text("Speaker 0") == "Goedemiddag. Daarom."
+        assert result.get_speaker_segments("Speaker 2") == []
+
+    def test_asdict_has_only_the_fields(self):
+        """Test that the speaker index does not leak into asdict()."""
+        result = make_result()
+        result.get_speaker_segments("Speaker 0")
+        assert result.total_duration == 3.5
+        assert list(dataclasses.asdict(result)) == ["audio_file", "speakers", "transcription", "metadata"]
+
+    def test_index_follows_changes_to_the_segments(self):
+        """Test that appending, replacing or relabelling segments is reflected in the speaker index."""
+        result = make_result()
+        assert result.unique_speakers == ["Speaker 0", "Speaker 1"]
+
+        result.speakers.append(SpeakerSegment("Speaker 2", 3.5, 4.0, 0.9, "Nee."))
+        assert result.unique_speakers == ["Speaker 0", "Speaker 1", "Speaker 2"]
+
+        result.speakers[1].speaker_id = "Speaker 0"
+        assert result.get_speaker_text("Speaker 0") == "Goedemiddag. Waarom? Daarom."
+
+        result.speakers = result.speakers[:1]
+        assert result.unique_speakers == ["Speaker 0"]
+        assert result.get_speaker_segments("Speaker 2") == []
+
+    def test_total_duration_follows_the_transcription(self):
+        """Test that the total duration reflects segments added after construction."""
+        result = make_result()
+        assert result.total_duration == 3.5
+        result.transcription.append(TranscriptionSegment("Nee.", 3.5, 9.0, 0.9))
+        assert result.total_duration == 9.0
+        assert DiarizationResult("empty.wav", [], [], {}).total_duration == 0.0
+
+    def test_slots(self):
+        """Test that the result models store their fields in slots."""
+        result = make_result()
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(result.speakers[0], "__dict__")
+        assert not hasattr(result.transcription[0], "__dict__")
+
+
+def word(text: str, start: float, end: float, probability: float = 1.0) -> SimpleNamespace:
+    """Fake faster-whisper word with timestamps."""
+    return SimpleNamespace(word=text, start=start, end=end, probability=probability)
+
+
+class TestAssignSpeakers:
+    """Test attributing transcribed words to speaker turns."""
+
+    def test_words_are_grouped_per_speaker_turn(self):
+        """Test that consecutive words of a speaker form one segment."""
+        words = [
+            word(" Goede", 0.0, 0.4, 0.9),
+            word("middag.", 0.4, 0.8, 0.7),
+            word(" Waarom?", 1.1, 1.5),
+            word(" Daarom.", 2.2, 2.6),
+        ]
+        turns = [(0.0, 1.0, "Speaker 0"), (1.0, 2.0, "Speaker 1"), (2.0, 3.0, "Speaker 0")]
+
+        segments = WhisperDiarizer._assign_speakers(words, turns)
+
+        assert [(seg.speaker_id, seg.text, seg.start_time, seg.end_time) for seg in segments] == [
+            ("Speaker 0", "Goedemiddag.", 0.0, 0.8),
+            ("Speaker 1", "Waarom?", 1.1, 1.5),
+            ("Speaker 0", "Daarom.", 2.2, 2.6),
+        ]
+        assert segments[0].confidence == pytest.approx(0.8)
+
+    def test_word_midpoint_decides_the_speaker(self):
+        """Test that a word spanning a turn change goes to the turn holding its midpoint."""
+        turns = [(0.0, 1.0, "Speaker 0"), (1.0, 2.0, "Speaker 1")]
+        segments = WhisperDiarizer._assign_speakers([word(" ja", 0.7, 1.1), word(" nee", 0.9, 1.5)], turns)
+        assert [(seg.speaker_id, seg.text) for seg in segments] == [("Speaker 0", "ja"), ("Speaker 1", "nee")]
+
+    def test_words_before_the_first_turn_go_to_the_first_speaker(self):
+        """Test that words preceding all turns are attributed to the first turn."""
+        segments = WhisperDiarizer._assign_speakers([word(" Hallo", 0.0, 0.2)], [(0.5, 1.0, "Speaker 1")])
+        assert [seg.speaker_id for seg in segments] == ["Speaker 1"]
+
+    def test_no_turns(self):
+        """Test that no segments are produced without speaker turns."""
+        assert WhisperDiarizer._assign_speakers([word(" Hallo", 0.0, 0.2)], []) == []
+
+
+class TestParseOutput:
+    """Test parsing of the legacy diarize.py transcript."""
+
+    def test_srt_cues_become_speaker_segments(self):
+        """Test that every SRT cue is parsed into a speaker and transcription segment."""
+        lines = iter([
+            "1\n",
+            "00:00:00,500 --> 00:00:02,250\n",
+            "Speaker 0: Goedemiddag allemaal.\n",
+            "\n",
+            "2\n",
+            "00:00:02,250 --> 00:01:03,000\n",
+            "Speaker 1: Waarom stemt u tegen\n",
+            "dit voorstel?\n",
+        ])
+
+        result = WhisperDiarizer._parse_output(lines, "interview.wav")
+
+        assert next(lines, None) is None
+        assert result.audio_file == "interview.wav"
+        assert [(seg.speaker_id, seg.start_time, seg.end_time) for seg in result.speakers] == [
+            ("Speaker 0", 0.5, 2.25),
+            ("Speaker 1", 2.25, 63.0),
+        ]
+        assert result.get_speaker_text("Speaker 1") == "Waarom stemt u tegen dit voorstel?"
+        assert [seg.text for seg in result.transcription] == [
+            "Goedemiddag allemaal.", "Waarom stemt u tegen dit voorstel?"
+        ]
+        assert result.metadata["num_speakers"] == 2
+        assert result.metadata["audio_duration"] == pytest.approx(63.0)
+
+    def test_empty_output(self):
+        """Test that an empty transcript gives an empty result."""
+        result = WhisperDiarizer._parse_output(iter([]), "silence.wav")
+        assert result.speakers == []
+        assert result.transcription == []
+        assert result.metadata["num_speakers"] == 0
+
+
+class TestSpeakerTurnsCache:
+    """Test the on-disk cache of speaker turns."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test that stored turns are read back as (start, end, speaker) tuples."""
+        cache_file = tmp_path / "audio.turns.json"
+        turns = [(0.0, 1.5, "speaker_0"), (1.5, 3.0, "speaker_1")]
+        WhisperDiarizer._write_cached_turns(cache_file, turns)
+        assert WhisperDiarizer._read_cached_turns(cache_file) == turns
+        assert list(tmp_path.iterdir()) == [cache_file]
+
+    def test_missing_or_unreadable_entries_are_misses(self, tmp_path):
+        """Test that a missing or partially written entry is treated as a cache miss."""
+        cache_file = tmp_path / "audio.turns.json"
+        assert WhisperDiarizer._read_cached_turns(cache_file) is None
+        cache_file.write_text('[[0.0, 1.5, "speaker_0"], [1.5', encoding="utf-8")
+        assert WhisperDiarizer._read_cached_turns(cache_file) is None
+
+
+class TestVideoInfo:
+    """Test reading video metadata with ffprobe."""
+
+    @pytest.fixture
+    def diarizer(self, tmp_path):
+        """Diarizer on an empty stand-in of the whisper-diarization repository."""
+        for name in ["diarize.py", "requirements.txt", "helpers.py"]:
+            (tmp_path / name).touch()
+        return WhisperDiarizer(str(tmp_path))
+
+    def test_missing_ffprobe(self, diarizer, tmp_path, monkeypatch):
+        """Test that a missing ffprobe is reported as a RuntimeError."""
+        video_file = tmp_path / "interview.mp4"
+        video_file.touch()
+
+        def run(cmd, **kwargs):
+            raise FileNotFoundError(cmd[0])
+
+        monkeypatch.setattr(diarizer, "is_video_processing_available", lambda: True)
+        monkeypatch.setattr(subprocess, "run", run)
+
+        with pytest.raises(RuntimeError, match="ffprobe"):
+            diarizer.get_video_info(str(video_file))
+        with pytest.raises(FileNotFoundError):
+            diarizer.get_video_info(str(tmp_path / "missing.mp4"))
@@ -16,7 +16,6 @@ from .config import (
     SDKConfig,
     WhisperConfig,
 )
-from .core import WhisperDiarizer
 from .models import DiarizationResult, SpeakerSegment, TranscriptionSegment
 
 __all__ = [
@@ -33,3 +32,12 @@ __all__ = [
     "__author__",
     "__email__"
 ]
+
+
+def __getattr__(name: str):
+    """Import WhisperDiarizer on first access, so the models and configs load without it."""
+    if name == "WhisperDiarizer":
+        from .core import WhisperDiarizer
+
+        return WhisperDiarizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,12 @@
 Configuration settings for the Whisper Diarization SDK.
 """
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Optional
 
+# Precisions the speaker embeddings can be extracted in on CUDA
+_EMBEDDING_PRECISIONS = ("float16", "bfloat16", "float32")
+
 
 @dataclass
 class WhisperConfig:
@@ -28,7 +31,19 @@ class DiarizationConfig:
     max_speakers: int = 10
     min_speaker_duration: float = 0.5
     clustering_threshold: float = 0.7
-    embedding_batch_size: int = 32
+    # Batch size of the VAD and speaker embedding passes; larger batches can exhaust
+    # 10-12 GB GPUs and spill into host memory, which is far slower than small batches
+    embedding_batch_size: int = 8
+    # Precision of the speaker embedding extraction on CUDA: "float16", "bfloat16" or "float32"
+    embedding_precision: str = "float16"
+    
+    def __post_init__(self):
+        """Reject unsupported embedding precisions before any model is loaded."""
+        if self.embedding_precision not in _EMBEDDING_PRECISIONS:
+            raise ValueError(
+                f"Unsupported embedding_precision {self.embedding_precision!r}, "
+                f"expected one of {', '.join(_EMBEDDING_PRECISIONS)}"
+            )
 
 
 @dataclass
@@ -50,15 +65,6 @@ class SDKConfig:
     diarization: DiarizationConfig
     audio: AudioConfig
     
-    def __post_init__(self):
-        """Initialize default configurations if not provided."""
-        if self.whisper is None:
-            self.whisper = WhisperConfig()
-        if self.diarization is None:
-            self.diarization = DiarizationConfig()
-        if self.audio is None:
-            self.audio = AudioConfig()
-    
     @classmethod
     def from_dict(cls, config_dict: dict) -> 'SDKConfig':
         """Create configuration from dictionary."""
@@ -74,32 +80,7 @@ class SDKConfig:
     
     def to_dict(self) -> dict:
         """Convert configuration to dictionary."""
-        return {
-            'whisper': {
-                'model_name': self.whisper.model_name,
-                'language': self.whisper.language,
-                'task': self.whisper.task,
-                'suppress_numerals': self.whisper.suppress_numerals,
-                'temperature': self.whisper.temperature,
-                'compression_ratio_threshold': self.whisper.compression_ratio_threshold,
-                'logprob_threshold': self.whisper.logprob_threshold,
-                'no_speech_threshold': self.whisper.no_speech_threshold
-            },
-            'diarization': {
-                'min_speakers': self.diarization.min_speakers,
-                'max_speakers': self.diarization.max_speakers,
-                'min_speaker_duration': self.diarization.min_speaker_duration,
-                'clustering_threshold': self.diarization.clustering_threshold,
-                'embedding_batch_size': self.diarization.embedding_batch_size
-            },
-            'audio': {
-                'sample_rate': self.audio.sample_rate,
-                'chunk_length': self.audio.chunk_length,
-                'overlap_length': self.audio.overlap_length,
-                'device': self.audio.device,
-                'batch_size': self.audio.batch_size
-            }
-        }
+        return asdict(self)
 
 
 # Default configuration
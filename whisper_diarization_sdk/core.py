@@ -2,32 +2,103 @@
 Core WhisperDiarizer class that integrates with the whisper-diarization repository.
 """
 
-import re
+import bisect
+import functools
+import hashlib
+import json
+import math
+import os
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, List, Optional, Tuple
 
+from .config import DiarizationConfig
 from .models import DiarizationResult, SpeakerSegment, TranscriptionSegment
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Pretrained NeMo models of the diarization pipeline, as used by diarize.py
+_DIARIZER_MODEL = "diar_msdd_telephonic"
+_VAD_MODEL = "vad_multilingual_marblenet"
+
+# Lines of diarize.py's stderr kept for the error message of a failed run
+_STDERR_TAIL_LINES = 200
+
+# Whisper models and language codes accepted by diarize
+_WHISPER_MODELS = (
+    "tiny.en", "tiny", "base.en", "base", "small.en", "small",
+    "medium.en", "medium", "large-v1", "large-v2", "large-v3"
+)
+
+_LANGUAGES = (
+    "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr",
+    "pl", "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi",
+    "he", "uk", "el", "ms", "cs", "ro", "da", "hu", "ta", "no",
+    "th", "ur", "hr", "bg", "lt", "la", "mi", "ml", "cy", "sk",
+    "te", "fa", "lv", "bn", "sr", "az", "sl", "kn", "et", "mk",
+    "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq", "sw",
+    "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc",
+    "ka", "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo",
+    "ht", "ps", "tk", "nn", "mt", "sa", "lb", "my", "bo", "tl",
+    "mg", "as", "tt", "haw", "ln", "ha", "ba", "jw", "su"
+)
+
+# Video file extensions whose audio track is extracted with ffmpeg
+_VIDEO_FORMATS = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp')
+_VIDEO_EXTENSIONS = frozenset(_VIDEO_FORMATS)
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """Check once per process whether ffmpeg can be run."""
+    try:
+        # Only the exit status matters, so the version banner is discarded instead of captured
+        subprocess.run(['ffmpeg', '-version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+
+def _srt_seconds(timestamp: str) -> float:
+    """Convert an SRT ``HH:MM:SS,mmm`` timestamp to seconds."""
+    hours, minutes, seconds = timestamp.strip().replace(",", ".").split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
 
 class WhisperDiarizer:
     """
     Main class for performing speaker diarization using OpenAI Whisper and NeMo.
 
-    This class provides a clean interface to the whisper-diarization pipeline
-    by wrapping the command-line tools from the cloned repository.
+    This class provides a clean interface to the whisper-diarization pipeline.
+    The Whisper and NeMo models are loaded in-process on first use and reused for
+    every following call; the command-line script of the cloned repository is still
+    available with ``legacy=True``.
     Supports both audio and video files (MP4, AVI, MOV, etc.).
     """
 
-    def __init__(self, whisper_diarization_path: Optional[str] = None):
+    def __init__(
+        self,
+        whisper_diarization_path: Optional[str] = None,
+        diarization_config: Optional[DiarizationConfig] = None,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize the WhisperDiarizer.
 
         Args:
             whisper_diarization_path: Path to the cloned whisper-diarization repository.
                                     If None, will look for it in the current directory.
+            diarization_config: Settings of the in-process diarizer (default: DiarizationConfig())
+            cache_dir: Directory for caching the speaker turns of diarized audio, keyed by
+                       the audio content (default: None, caching disabled)
         """
         if whisper_diarization_path is None:
             # Look for the repository in common locations
@@ -50,6 +121,19 @@ class WhisperDiarizer:
 
         self.whisper_diarization_path = Path(whisper_diarization_path)
         self._validate_repository()
+        self.diarization_config = diarization_config or DiarizationConfig()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Make the helpers of the repository importable for the in-process pipeline; the
+        # path is appended so the repository's modules never shadow installed packages
+        if str(self.whisper_diarization_path) not in sys.path:
+            sys.path.append(str(self.whisper_diarization_path))
+
+        # Loaded models, keyed by (whisper model, device) and device
+        self._whisper_models: Dict[Tuple[str, str], Any] = {}
+        self._diarizers: Dict[str, Any] = {}
 
     def _validate_repository(self) -> None:
         """Validate that the whisper-diarization repository is properly set up."""
@@ -62,15 +146,15 @@ class WhisperDiarizer:
 
     def _is_video_file(self, file_path: str) -> bool:
         """Check if the file is a video file based on extension."""
-        video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp'}
-        return Path(file_path).suffix.lower() in video_extensions
+        return Path(file_path).suffix.lower() in _VIDEO_EXTENSIONS
 
-    def _extract_audio_from_video(self, video_file: str) -> str:
+    def _extract_audio_from_video(self, video_file: str, out_dir: str) -> str:
         """
         Extract audio from video file using ffmpeg.
 
         Args:
             video_file: Path to the video file
+            out_dir: Directory to write the extracted audio to, e.g. a temporary directory
 
         Returns:
             Path to the extracted audio file (WAV format)
@@ -78,18 +162,13 @@ class WhisperDiarizer:
         Raises:
             RuntimeError: If ffmpeg is not available or extraction fails
         """
-        try:
-            # Check if ffmpeg is available
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not self.is_video_processing_available():
             raise RuntimeError(
                 "ffmpeg is required for video processing. "
                 "Please install ffmpeg: https://ffmpeg.org/download.html"
             )
 
-        # Create temporary file for extracted audio
-        temp_audio = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-        temp_audio.close()
+        audio_file = str(Path(out_dir) / "audio.wav")
 
         try:
             # Extract audio using ffmpeg
@@ -100,17 +179,56 @@ class WhisperDiarizer:
                 '-ar', '16000',  # 16kHz sample rate
                 '-ac', '1',  # Mono
                 '-y',  # Overwrite output file
-                temp_audio.name
+                audio_file
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return temp_audio.name
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            return audio_file
 
         except subprocess.CalledProcessError as e:
-            # Clean up temp file on failure
-            Path(temp_audio.name).unlink(missing_ok=True)
             raise RuntimeError(f"Failed to extract audio from video: {e.stderr}") from e
 
+    def _read_video_audio(self, video_file: str) -> "np.ndarray":
+        """
+        Decode the audio track of a video file in memory using ffmpeg.
+
+        The PCM stream is piped from ffmpeg instead of being written to and read
+        back from a temporary WAV file.
+
+        Args:
+            video_file: Path to the video file
+
+        Returns:
+            Mono 16 kHz float32 samples in [-1, 1]
+
+        Raises:
+            RuntimeError: If ffmpeg is not available or extraction fails
+        """
+        import numpy as np
+
+        if not self.is_video_processing_available():
+            raise RuntimeError(
+                "ffmpeg is required for video processing. "
+                "Please install ffmpeg: https://ffmpeg.org/download.html"
+            )
+
+        cmd = [
+            'ffmpeg', '-i', video_file,
+            '-vn',  # No video
+            '-f', 's16le',  # Raw PCM 16-bit to stdout
+            '-acodec', 'pcm_s16le',
+            '-ar', '16000',  # 16kHz sample rate
+            '-ac', '1',  # Mono
+            '-'
+        ]
+
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to extract audio from video: {e.stderr.decode(errors='replace')}") from e
+
+        return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
     def diarize(
         self,
         audio_file: str,
@@ -119,7 +237,8 @@ class WhisperDiarizer:
         device: str = "auto",
         language: Optional[str] = None,
         batch_size: int = 0,
-        output_format: str = "json"
+        output_format: str = "json",
+        legacy: bool = False
     ) -> DiarizationResult:
         """
         Perform speaker diarization on an audio or video file.
@@ -132,6 +251,8 @@ class WhisperDiarizer:
             language: Language code (if known)
             batch_size: Batch size for processing (0 for non-batched)
             output_format: Output format (json, srt, txt)
+            legacy: Run the repository's diarize.py script in a subprocess instead of
+                    the in-process models (reloads all models on every call)
 
         Returns:
             DiarizationResult object containing the diarization results
@@ -140,15 +261,20 @@ class WhisperDiarizer:
         if not Path(audio_file).exists():
             raise FileNotFoundError(f"File not found: {audio_file}")
 
-        # Handle video files by extracting audio first
-        temp_audio_file = None
-        try:
+        if not legacy:
+            audio = self._load_audio(audio_file)
+            return self._diarize_in_process(
+                audio_file, audio, whisper_model, suppress_numerals, device, language, batch_size
+            )
+
+        # Handle video files by extracting audio first; the temporary directory is
+        # removed with everything in it, also when extraction or diarization fails
+        with tempfile.TemporaryDirectory() as temp_dir:
             if self._is_video_file(audio_file):
                 print(f"Detected video file: {audio_file}")
                 print("Extracting audio for processing...")
-                temp_audio_file = self._extract_audio_from_video(audio_file)
-                print(f"Audio extracted to: {temp_audio_file}")
-                processing_file = temp_audio_file
+                processing_file = self._extract_audio_from_video(audio_file, temp_dir)
+                print(f"Audio extracted to: {processing_file}")
             else:
                 processing_file = audio_file
 
@@ -168,49 +294,375 @@ class WhisperDiarizer:
             if language:
                 cmd.extend(["--language", language])
 
-            # Run the diarization
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    cwd=self.whisper_diarization_path,
-                    check=True
-                )
+            # Run the diarization; its stdout only reports progress and is discarded line by
+            # line as it is produced instead of being buffered
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                cwd=self.whisper_diarization_path
+            ) as process:
+                # Drain stderr concurrently so neither pipe fills up and blocks the script;
+                # only its tail is kept for the error message
+                stderr_tail: Deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+                stderr_reader = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+                stderr_reader.start()
+
+                try:
+                    deque(process.stdout, maxlen=0)
+                except BaseException:
+                    process.kill()
+                    raise
+                finally:
+                    process.wait()
+                    stderr_reader.join()
+
+            if process.returncode != 0:
+                raise RuntimeError(f"Diarization failed: {''.join(stderr_tail)}")
+
+            # diarize.py writes the speaker-labelled transcript next to the processed audio
+            with open(Path(processing_file).with_suffix(".srt"), encoding="utf-8-sig") as srt_file:
+                return self._parse_output(srt_file, audio_file)
+
+    def _load_audio(self, audio_file: str) -> "np.ndarray":
+        """Decode an audio or video file to mono 16 kHz float32 samples."""
+        if self._is_video_file(audio_file):
+            return self._read_video_audio(audio_file)
+
+        import faster_whisper
+
+        return faster_whisper.decode_audio(audio_file, sampling_rate=16000)
+
+    def diarize_batch(
+        self,
+        audio_files: List[str],
+        whisper_model: str = "medium.en",
+        suppress_numerals: bool = True,
+        device: str = "auto",
+        language: Optional[str] = None,
+        batch_size: int = 0,
+        max_workers: int = 2
+    ) -> List[DiarizationResult]:
+        """
+        Perform speaker diarization on many audio or video files.
+
+        While a file is being transcribed and diarized, the audio of the next
+        ``max_workers`` files is already decoded on a thread pool (ffmpeg and the
+        decoders release the GIL), so the models do not sit idle between files.
+
+        Args:
+            audio_files: Paths to the audio or video files to process
+            whisper_model: Whisper model to use (default: medium.en)
+            suppress_numerals: Whether to suppress numerals in transcription
+            device: Device to use (cuda, cpu, or auto)
+            language: Language code (if known)
+            batch_size: Batch size for processing (0 for non-batched)
+            max_workers: Number of files to decode ahead (default: 2)
 
-                # Parse the output and create DiarizationResult
-                return self._parse_output(result.stdout, audio_file)
+        Returns:
+            DiarizationResult objects in the same order as ``audio_files``
+        """
+        for audio_file in audio_files:
+            if not Path(audio_file).exists():
+                raise FileNotFoundError(f"File not found: {audio_file}")
+
+        device = self._resolve_device(device)
+        results: List[DiarizationResult] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Bounded look-ahead, so at most max_workers decoded files wait in memory
+            pending = deque(
+                executor.submit(self._load_audio, audio_file) for audio_file in audio_files[:max_workers]
+            )
+            for index, audio_file in enumerate(audio_files):
+                audio = pending.popleft().result()
+                if index + max_workers < len(audio_files):
+                    pending.append(executor.submit(self._load_audio, audio_files[index + max_workers]))
 
-            except subprocess.CalledProcessError as e:
-                raise RuntimeError(
-                    f"Diarization failed: {e.stderr}"
-                ) from e
+                results.append(self._diarize_in_process(
+                    audio_file, audio, whisper_model, suppress_numerals, device, language, batch_size
+                ))
 
-        finally:
-            # Clean up temporary audio file if it was created
-            if temp_audio_file and Path(temp_audio_file).exists():
-                Path(temp_audio_file).unlink()
-                print(f"Cleaned up temporary audio file: {temp_audio_file}")
+        return results
 
-    def _parse_output(self, output: str, audio_file: str) -> DiarizationResult:
+    def _diarize_in_process(
+        self,
+        audio_file: str,
+        audio: "np.ndarray",
+        whisper_model: str,
+        suppress_numerals: bool,
+        device: str,
+        language: Optional[str],
+        batch_size: int
+    ) -> DiarizationResult:
         """
-        Parse the output from the diarization script.
+        Transcribe and diarize the decoded audio of a file with the preloaded models.
 
-        This is a simplified parser - in practice, you might want to modify
-        the diarization script to output structured data.
+        Whisper provides the transcription with word timestamps, the NeMo MSDD
+        diarizer the speaker turns; every word is attributed to the speaker turn
+        it falls in and consecutive words of a speaker form one SpeakerSegment.
         """
-        # For now, create a basic result structure
-        # In practice, you'd want to modify the diarization script to output JSON
+        start = time.perf_counter()
+        device = self._resolve_device(device)
+        segments, info = self._transcribe(audio, whisper_model, suppress_numerals, device, language, batch_size)
+        transcription: List[TranscriptionSegment] = []
+        words: List[Any] = []
+        for segment in segments:
+            transcription.append(TranscriptionSegment(
+                text=segment.text.strip(),
+                start_time=segment.start,
+                end_time=segment.end,
+                confidence=math.exp(segment.avg_logprob),
+                language=info.language
+            ))
+            words.extend(segment.words or [])
+
+        speakers = self._assign_speakers(words, self._diarize_turns(audio, device))
+
         metadata = {
-            "processing_time": None,
-            "whisper_model": None,
-            "num_speakers": 0,
-            "audio_duration": None
+            "processing_time": time.perf_counter() - start,
+            "whisper_model": whisper_model,
+            "num_speakers": len({segment.speaker_id for segment in speakers}),
+            "audio_duration": info.duration,
+            "language": info.language
         }
 
-        # Create placeholder segments (you'd parse the actual output here)
+        return DiarizationResult(
+            audio_file=audio_file,
+            speakers=speakers,
+            transcription=transcription,
+            metadata=metadata
+        )
+
+    def _diarize_turns(self, audio: "np.ndarray", device: str) -> List[Tuple[float, float, str]]:
+        """
+        Return the sorted (start, end, speaker) turns of the audio from the NeMo diarizer.
+
+        With a cache directory, the turns are stored under a hash of the audio samples
+        and diarizer settings, so re-processing the same audio skips the VAD, embedding
+        and clustering passes entirely.
+        """
+        cache_file = self._turns_cache_file(audio) if self.cache_dir is not None else None
+        cached_turns = self._read_cached_turns(cache_file) if cache_file is not None else None
+        if cached_turns is not None:
+            return cached_turns
+
+        import soundfile
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # NeMo reads the audio from disk, as a mono 16 kHz WAV
+            mono_file = str(Path(temp_dir) / "mono_file.wav")
+            soundfile.write(mono_file, audio, 16000)
+            annotation = self._get_diarizer(device)(
+                audio_filepath=mono_file,
+                out_dir=temp_dir,
+                batch_size=self.diarization_config.embedding_batch_size,
+                max_speakers=self.diarization_config.max_speakers
+            )
+
+        turns = sorted(
+            (turn.start, turn.end, speaker) for turn, _, speaker in annotation.itertracks(yield_label=True)
+        )
+        if cache_file is not None:
+            self._write_cached_turns(cache_file, turns)
+
+        return turns
+
+    def _turns_cache_file(self, audio: "np.ndarray") -> Path:
+        """Return the cache file of the speaker turns of the audio under the current settings."""
+        # Hash the samples in place rather than copying the whole waveform with tobytes()
+        key = hashlib.blake2b(memoryview(audio), digest_size=16)
+        config = self.diarization_config
+        key.update(f"{_DIARIZER_MODEL}:{_VAD_MODEL}:{config.max_speakers}:{config.embedding_precision}".encode())
+        return self.cache_dir / f"{key.hexdigest()}.turns.json"
+
+    @staticmethod
+    def _read_cached_turns(cache_file: Path) -> Optional[List[Tuple[float, float, str]]]:
+        """Return the cached speaker turns, or None when the entry is missing or unreadable."""
+        try:
+            return [tuple(turn) for turn in json.loads(cache_file.read_text(encoding="utf-8"))]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Ignoring unreadable speaker turns cache {cache_file}: {e}")
+            return None
+
+    @staticmethod
+    def _write_cached_turns(cache_file: Path, turns: List[Tuple[float, float, str]]) -> None:
+        """Store the speaker turns of an audio file in the cache."""
+        # Write to a temporary file first so a crash never leaves a partial entry behind
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(turns, f)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            Path(tmp_path).unlink(missing_ok=True)
+            print(f"Failed to write speaker turns cache {cache_file}: {e}")
+
+    def _transcribe(
+        self,
+        audio: Any,
+        whisper_model: str,
+        suppress_numerals: bool,
+        device: str,
+        language: Optional[str],
+        batch_size: int
+    ) -> Tuple[Any, Any]:
+        """Transcribe audio with word timestamps, returning faster-whisper's (segments, info)."""
+        from helpers import find_numeral_symbol_tokens
+
+        model = self._get_whisper_model(whisper_model, device)
+        suppress_tokens = find_numeral_symbol_tokens(model.hf_tokenizer) if suppress_numerals else [-1]
+
+        if batch_size > 0:
+            import faster_whisper
+
+            return faster_whisper.BatchedInferencePipeline(model).transcribe(
+                audio,
+                language=language,
+                suppress_tokens=suppress_tokens,
+                batch_size=batch_size,
+                word_timestamps=True
+            )
+
+        return model.transcribe(
+            audio,
+            language=language,
+            suppress_tokens=suppress_tokens,
+            vad_filter=True,
+            word_timestamps=True
+        )
+
+    @staticmethod
+    def _resolve_device(device: str) -> str:
+        """Resolve the "auto" device to cuda when available, cpu otherwise."""
+        if device != "auto":
+            return device
+
+        import torch
+
+        return "cuda" if torch.cuda.is_available() else "cpu"
+
+    def _get_whisper_model(self, whisper_model: str, device: str) -> Any:
+        """Return the faster-whisper model, loading it on first use."""
+        key = (whisper_model, device)
+        if key not in self._whisper_models:
+            import faster_whisper
+
+            compute_type = "float16" if device == "cuda" else "int8"
+            self._whisper_models[key] = faster_whisper.WhisperModel(
+                whisper_model, device=device, compute_type=compute_type
+            )
+        return self._whisper_models[key]
+
+    def _get_diarizer(self, device: str) -> Any:
+        """Return the NeMo MSDD diarizer, loading it on first use."""
+        if device not in self._diarizers:
+            from nemo.collections.asr.models.msdd_models import NeuralDiarizer
+
+            diarizer = NeuralDiarizer.from_pretrained(
+                model_name=_DIARIZER_MODEL, vad_model_name=_VAD_MODEL, map_location=device
+            )
+            self._set_embedding_precision(diarizer, device)
+            self._diarizers[device] = diarizer
+        return self._diarizers[device]
+
+    def _set_embedding_precision(self, diarizer: Any, device: str) -> None:
+        """
+        Run the speaker embedding extraction of the diarizer in ``embedding_precision``.
+
+        On CUDA, only the forward pass of the speaker embedding models is wrapped in
+        autocast to use tensor cores; VAD, clustering and the MSDD network keep
+        running in float32, so reduced precision cannot change the clustering.
+        """
+        precision = self.diarization_config.embedding_precision
+        if device != "cuda" or precision == "float32":
+            return
+
+        import torch
+        from nemo.collections.asr.models import EncDecSpeakerLabelModel
+
+        autocast = torch.autocast(device_type="cuda", dtype=getattr(torch, precision))
+        for module in diarizer.modules():
+            if isinstance(module, EncDecSpeakerLabelModel):
+                module.forward = autocast(module.forward)
+
+    @staticmethod
+    def _assign_speakers(words: List[Any], turns: List[Tuple[float, float, str]]) -> List[SpeakerSegment]:
+        """
+        Group transcribed words into speaker segments.
+
+        Each word is attributed to the last speaker turn starting before its
+        midpoint; consecutive words of the same speaker are merged.
+        """
+        if not turns:
+            return []
+
+        turn_starts = [start for start, _, _ in turns]
+        groups: List[Tuple[str, List[Any]]] = []
+        for word in words:
+            midpoint = (word.start + word.end) / 2
+            speaker = turns[max(bisect.bisect_right(turn_starts, midpoint) - 1, 0)][2]
+            if groups and groups[-1][0] == speaker:
+                groups[-1][1].append(word)
+            else:
+                groups.append((speaker, [word]))
+
+        return [
+            SpeakerSegment(
+                speaker_id=speaker,
+                start_time=group[0].start,
+                end_time=group[-1].end,
+                confidence=sum(word.probability for word in group) / len(group),
+                text="".join(word.word for word in group).strip()
+            )
+            for speaker, group in groups
+        ]
+
+    @staticmethod
+    def _parse_output(lines: Iterable[str], audio_file: str) -> DiarizationResult:
+        """
+        Parse the SRT transcript written by the diarization script.
+
+        Every cue holds one speaker turn as ``Speaker N: text``; the lines are
+        consumed one by one, so the transcript is never held in memory as a whole.
+        """
         speakers: List[SpeakerSegment] = []
         transcription: List[TranscriptionSegment] = []
+        timing: Optional[Tuple[float, float]] = None
+        cue_text: List[str] = []
+
+        def add_cue():
+            speaker, _, text = " ".join(cue_text).partition(": ")
+            # diarize.py does not report confidences in its transcript
+            speakers.append(SpeakerSegment(
+                speaker_id=speaker, start_time=timing[0], end_time=timing[1], confidence=1.0, text=text
+            ))
+            transcription.append(TranscriptionSegment(
+                text=text, start_time=timing[0], end_time=timing[1], confidence=1.0
+            ))
+
+        for line in lines:
+            line = line.strip()
+            if "-->" in line:
+                start, _, end = line.partition("-->")
+                timing = (_srt_seconds(start), _srt_seconds(end))
+            elif line and timing is not None:
+                cue_text.append(line)
+            elif not line and cue_text:
+                add_cue()
+                timing, cue_text = None, []
+        if cue_text:
+            add_cue()
+
+        metadata = {
+            "processing_time": None,
+            "whisper_model": None,
+            "num_speakers": len({segment.speaker_id for segment in speakers}),
+            "audio_duration": transcription[-1].end_time if transcription else None
+        }
 
         return DiarizationResult(
             audio_file=audio_file,
@@ -219,48 +671,32 @@ class WhisperDiarizer:
             metadata=metadata
         )
 
-    def get_available_models(self) -> List[str]:
-        """Get list of available Whisper models."""
-        return [
-            "tiny.en", "tiny", "base.en", "base", "small.en", "small",
-            "medium.en", "medium", "large-v1", "large-v2", "large-v3"
-        ]
+    def get_available_models(self) -> Tuple[str, ...]:
+        """Get the available Whisper models."""
+        return _WHISPER_MODELS
 
-    def get_supported_languages(self) -> List[str]:
-        """Get list of supported language codes."""
-        return [
-            "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr",
-            "pl", "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi",
-            "he", "uk", "el", "ms", "cs", "ro", "da", "hu", "ta", "no",
-            "th", "ur", "hr", "bg", "lt", "la", "mi", "ml", "cy", "sk",
-            "te", "fa", "lv", "bn", "sr", "az", "sl", "kn", "et", "mk",
-            "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq", "sw",
-            "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc",
-            "ka", "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo",
-            "ht", "ps", "tk", "nn", "mt", "sa", "lb", "my", "bo", "tl",
-            "mg", "as", "tt", "haw", "ln", "ha", "ba", "jw", "su"
-        ]
+    def get_supported_languages(self) -> Tuple[str, ...]:
+        """Get the supported language codes."""
+        return _LANGUAGES
 
-    def get_supported_video_formats(self) -> List[str]:
-        """Get list of supported video file extensions."""
-        return ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp']
+    def get_supported_video_formats(self) -> Tuple[str, ...]:
+        """Get the supported video file extensions."""
+        return _VIDEO_FORMATS
 
     def is_video_processing_available(self) -> bool:
         """
         Check if video processing is available (ffmpeg installed).
 
+        The check runs ffmpeg once per process; the result is reused afterwards.
+
         Returns:
             True if ffmpeg is available, False otherwise
         """
-        try:
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return _ffmpeg_available()
 
     def get_video_info(self, video_file: str) -> dict:
         """
-        Get basic information about a video file using ffmpeg.
+        Get basic information about a video file using ffprobe.
 
         Args:
             video_file: Path to the video file
@@ -269,7 +705,8 @@ class WhisperDiarizer:
             Dictionary containing video information (duration, resolution, etc.)
 
         Raises:
-            RuntimeError: If ffmpeg is not available or file doesn't exist
+            RuntimeError: If ffmpeg or ffprobe is not available
+            FileNotFoundError: If the video file doesn't exist
         """
         if not self.is_video_processing_available():
             raise RuntimeError("ffmpeg is required for video processing")
@@ -278,39 +715,38 @@ class WhisperDiarizer:
             raise FileNotFoundError(f"Video file not found: {video_file}")
 
         try:
+            # ffprobe only reads the container header instead of decoding the whole file
             cmd = [
-                'ffmpeg', '-i', video_file,
-                '-f', 'null', '-'
+                'ffprobe', '-v', 'error',
+                '-show_format', '-show_streams',
+                '-print_format', 'json',
+                video_file
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            probe = json.loads(result.stdout)
 
-            # Parse ffmpeg output for duration and other info
             info: dict = {}
 
-            # Extract duration from stderr (ffmpeg outputs info to stderr)
-            duration_match = re.search(r'Duration: (\d{2}):(\d{2}):(\d{2})\.(\d{2})', result.stderr)
-            if duration_match:
-                hours, minutes, seconds, centiseconds = map(int, duration_match.groups())
-                info['duration'] = hours * 3600 + minutes * 60 + seconds + centiseconds / 100
-
-            # Extract resolution
-            resolution_match = re.search(r'(\d{3,4})x(\d{3,4})', result.stderr)
-            if resolution_match:
-                info['width'] = int(resolution_match.group(1))
-                info['height'] = int(resolution_match.group(2))
-
-            # Extract audio codec
-            audio_match = re.search(r'Audio: (\w+)', result.stderr)
-            if audio_match:
-                info['audio_codec'] = audio_match.group(1)
-
-            # Extract video codec
-            video_match = re.search(r'Video: (\w+)', result.stderr)
-            if video_match:
-                info['video_codec'] = video_match.group(1)
+            duration = probe.get('format', {}).get('duration')
+            if duration is not None:
+                info['duration'] = float(duration)
+
+            # Report the first video and audio stream
+            for stream in probe.get('streams', []):
+                codec_type = stream.get('codec_type')
+                if codec_type == 'video' and 'video_codec' not in info:
+                    info['video_codec'] = stream.get('codec_name')
+                    if 'width' in stream and 'height' in stream:
+                        info['width'] = stream['width']
+                        info['height'] = stream['height']
+                elif codec_type == 'audio' and 'audio_codec' not in info:
+                    info['audio_codec'] = stream.get('codec_name')
 
             return info
 
+        except FileNotFoundError as e:
+            # ffprobe ships with ffmpeg, but may be missing from a minimal installation
+            raise RuntimeError("ffprobe is required for reading video information") from e
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to get video info: {e.stderr}") from e
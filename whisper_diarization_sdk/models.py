@@ -4,10 +4,15 @@ Data models for the Whisper Diarization SDK.
 
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 
+_text = attrgetter("text")
+_speaker_id = attrgetter("speaker_id")
+_end_time = attrgetter("end_time")
 
-@dataclass
+
+@dataclass(slots=True)
 class SpeakerSegment:
     """Represents a segment of audio attributed to a specific speaker."""
     
@@ -33,7 +38,7 @@ class SpeakerSegment:
         return timedelta(seconds=self.end_time)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionSegment:
     """Represents a transcription segment with timing information."""
     
@@ -49,32 +54,55 @@ class TranscriptionSegment:
         return self.end_time - self.start_time
 
 
-@dataclass
-class DiarizationResult:
-    """Complete result of the diarization process."""
+class _SpeakerIndexSlot:
+    """Slot holding the speaker index of a DiarizationResult, outside its dataclass fields."""
+    __slots__ = ("_speaker_index",)
+
+
+@dataclass(slots=True)
+class DiarizationResult(_SpeakerIndexSlot):
+    """
+    Complete result of the diarization process.
+
+    The speaker segments are indexed by speaker ID on first use; the index is
+    rebuilt whenever the segments, their order or their speaker IDs change.
+    """
     
     audio_file: str
     speakers: List[SpeakerSegment]
     transcription: List[TranscriptionSegment]
     metadata: Dict[str, Any]
     
+    def _by_speaker(self) -> Dict[str, List[SpeakerSegment]]:
+        """Speaker segments indexed by speaker ID, in order of first appearance."""
+        # Comparing snapshots of the segments and their speaker IDs is a C-level pass,
+        # much cheaper than regrouping the segments on every lookup
+        segments = tuple(self.speakers)
+        speaker_ids = tuple(map(_speaker_id, segments))
+        cached = getattr(self, "_speaker_index", None)
+        if cached is not None and cached[0] == segments and cached[1] == speaker_ids:
+            return cached[2]
+
+        by_speaker: Dict[str, List[SpeakerSegment]] = {}
+        for segment in segments:
+            by_speaker.setdefault(segment.speaker_id, []).append(segment)
+        self._speaker_index = (segments, speaker_ids, by_speaker)
+        return by_speaker
+    
     @property
     def total_duration(self) -> float:
         """Total duration of the audio file."""
-        if not self.transcription:
-            return 0.0
-        return max(seg.end_time for seg in self.transcription)
+        return max(map(_end_time, self.transcription), default=0.0)
     
     @property
     def unique_speakers(self) -> List[str]:
         """List of unique speaker IDs."""
-        return list(set(seg.speaker_id for seg in self.speakers))
+        return list(self._by_speaker())
     
     def get_speaker_segments(self, speaker_id: str) -> List[SpeakerSegment]:
         """Get all segments for a specific speaker."""
-        return [seg for seg in self.speakers if seg.speaker_id == speaker_id]
+        return list(self._by_speaker().get(speaker_id, ()))
     
     def get_speaker_text(self, speaker_id: str) -> str:
         """Get all text spoken by a specific speaker."""
-        segments = self.get_speaker_segments(speaker_id)
-        return " ".join(seg.text for seg in segments)
+        return " ".join(map(_text, self._by_speaker().get(speaker_id, ())))